@@ -28,24 +28,17 @@ def create_monthly_charts_corrected():
     months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']
     month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     
-    # Create results dictionary
-    monthly_averages = {}
+    # Average of each month across all years, one row per metric (6 x 12)
+    monthly_cols = [f"{month}_{metric}" for metric in monthly_metrics for month in months]
+    monthly_averages = df[monthly_cols].mean().to_numpy(dtype=np.float32).reshape(
+        len(monthly_metrics), len(months))
     
     print("\n=== MONTHLY AVERAGES (CORRECTED DATA) ===")
     
-    # Calculate monthly averages for each metric
-    for metric in monthly_metrics:
+    for metric, monthly_vals in zip(monthly_metrics, monthly_averages):
         print(f"\n--- {metric.upper()} ---")
-        monthly_vals = []
-        
-        for month in months:
-            col = f"{month}_{metric}"
-            # Calculate average of this month across all years
-            month_avg = df[col].mean()
-            monthly_vals.append(month_avg)
+        for month, month_avg in zip(months, monthly_vals):
             print(f"{month.upper()}: {month_avg:.2f}")
-        
-        monthly_averages[metric] = monthly_vals
     
     # Create visualization without main title
     fig, axes = plt.subplots(2, 3, figsize=(24, 16))
@@ -53,7 +46,6 @@ def create_monthly_charts_corrected():
     # No main title - just use the space for charts
     plt.subplots_adjust(hspace=0.5, wspace=0.4, top=0.95, bottom=0.1, left=0.08, right=0.95)
     
-    metrics = list(monthly_averages.keys())
     metric_titles = [
         'Flow Max (m³/s)', 'Flow Min (m³/s)', 'Flow Avg (m³/s)',
         'LT/SN/Km²', 'AKIM mm', 'MIL M³'
@@ -62,16 +54,16 @@ def create_monthly_charts_corrected():
     # Define colors for each metric
     colors = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#7209B7', '#2D5016']
     
-    for i, (metric, title, color) in enumerate(zip(metrics, metric_titles, colors)):
+    for i, (title, color) in enumerate(zip(metric_titles, colors)):
         row = i // 3
         col = i % 3
         ax = axes[row, col]
         
-        values = monthly_averages[metric]
+        values = monthly_averages[i]
         
         # Create line plot with better styling
-        ax.plot(range(12), values, marker='o', linewidth=3, markersize=12, 
-                color=color, markerfacecolor=color, markeredgecolor='white', markeredgewidth=2)
+        ax.plot(range(12), values, '-', marker='o', linewidth=3, markersize=12, 
+                color=color, markerfacecolor=color, markeredgewidth=0)
         ax.fill_between(range(12), values, alpha=0.2, color=color)
         
         # Customize the plot with larger fonts
@@ -3,12 +3,23 @@
 Create monthly data changes charts showing how monthly values change over time
 """
 
+import os
+import pickle
+import sys
+from multiprocessing import get_context
+from pathlib import Path
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 import numpy as np
 import seaborn as sns
+from numba import njit, prange
 from scipy import stats
 from matplotlib.patches import Rectangle
+from monthly_schema import METRICS, MONTH_NAMES, SEASON_IDX
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -16,65 +27,121 @@ warnings.filterwarnings('ignore')
 plt.style.use('default')
 sns.set_palette("husl")
 
+# Line colors for the 12 months and box colors for the 4 seasons
+_MONTH_COLORS = plt.cm.tab20(np.linspace(0, 1, 12))
+_SEASON_COLORS = ('#FF9999', '#66B3FF', '#99FF99', '#FFCC99')
+
+# Bump whenever the layout of prepare_aggregates' output changes; together with
+# the schema fingerprint this invalidates .prepared.pkl files from older runs
+CACHE_VERSION = 2
+_SCHEMA_FINGERPRINT = repr((METRICS, MONTH_NAMES))
+
+@njit(parallel=True, cache=True)
+def pairwise_pearson(X):
+    """Pearson correlation between columns of X using pairwise-complete rows
+    (same NaN handling as DataFrame.corr)"""
+    n_rows, n_cols = X.shape
+    out = np.empty((n_cols, n_cols))
+    
+    for j in prange(n_cols):
+        for k in range(j, n_cols):
+            # Means over rows where both columns are present
+            n = 0
+            sum_x = 0.0
+            sum_y = 0.0
+            for i in range(n_rows):
+                x = X[i, j]
+                y = X[i, k]
+                if not (np.isnan(x) or np.isnan(y)):
+                    n += 1
+                    sum_x += x
+                    sum_y += y
+            
+            r = np.nan
+            if n > 1:
+                mean_x = sum_x / n
+                mean_y = sum_y / n
+                sxx = 0.0
+                syy = 0.0
+                sxy = 0.0
+                for i in range(n_rows):
+                    x = X[i, j]
+                    y = X[i, k]
+                    if not (np.isnan(x) or np.isnan(y)):
+                        dx = x - mean_x
+                        dy = y - mean_y
+                        sxx += dx * dx
+                        syy += dy * dy
+                        sxy += dx * dy
+                if sxx > 0.0 and syy > 0.0:
+                    r = min(max(sxy / np.sqrt(sxx * syy), -1.0), 1.0)
+            
+            out[j, k] = r
+            out[k, j] = r
+    
+    return out
+
+@njit(cache=True)
+def column_mean_std(X, ddof):
+    """One-pass (Welford) NaN-skipping mean and std of each column of X"""
+    n_rows, n_cols = X.shape
+    count = np.zeros(n_cols, dtype=np.int64)
+    mean = np.zeros(n_cols)
+    m2 = np.zeros(n_cols)
+    
+    for i in range(n_rows):
+        for j in range(n_cols):
+            v = X[i, j]
+            if not np.isnan(v):
+                count[j] += 1
+                delta = v - mean[j]
+                mean[j] += delta / count[j]
+                m2[j] += delta * (v - mean[j])
+    
+    std = np.full(n_cols, np.nan)
+    for j in range(n_cols):
+        if count[j] == 0:
+            mean[j] = np.nan
+        if count[j] > ddof:
+            std[j] = np.sqrt(m2[j] / (count[j] - ddof))
+    
+    return mean, std
+
+@njit(parallel=True, cache=True)
+def groupby_mean(group_codes, X, n_groups):
+    """NaN-skipping mean of each column of X per group code (0..n_groups-1);
+    rows with a negative code (pd.factorize's NaN key) are skipped"""
+    n_rows, n_cols = X.shape
+    out = np.full((n_groups, n_cols), np.nan)
+    
+    for j in prange(n_cols):
+        sums = np.zeros(n_groups)
+        counts = np.zeros(n_groups, dtype=np.int64)
+        for i in range(n_rows):
+            g = group_codes[i]
+            v = X[i, j]
+            if g >= 0 and not np.isnan(v):
+                sums[g] += v
+                counts[g] += 1
+        for g in range(n_groups):
+            if counts[g] > 0:
+                out[g, j] = sums[g] / counts[g]
+    
+    return out
+
 def load_and_prepare_data(csv_file):
     """Load CSV data and prepare monthly data"""
-    df = pd.read_csv(csv_file)
-    
-    # Define the 6 metrics and their monthly columns
-    metrics = {
-        'Flow Max (m³/s)': {
-            'columns': ['oct_flow_max_m3', 'nov_flow_max_m3', 'dec_flow_max_m3', 
-                       'jan_flow_max_m3', 'feb_flow_max_m3', 'mar_flow_max_m3',
-                       'apr_flow_max_m3', 'may_flow_max_m3', 'jun_flow_max_m3',
-                       'jul_flow_max_m3', 'aug_flow_max_m3', 'sep_flow_max_m3'],
-            'color': '#FF6B6B',
-            'unit': 'm³/s'
-        },
-        'Flow Min (m³/s)': {
-            'columns': ['oct_flow_min_m3', 'nov_flow_min_m3', 'dec_flow_min_m3',
-                       'jan_flow_min_m3', 'feb_flow_min_m3', 'mar_flow_min_m3',
-                       'apr_flow_min_m3', 'may_flow_min_m3', 'jun_flow_min_m3',
-                       'jul_flow_min_m3', 'aug_flow_min_m3', 'sep_flow_min_m3'],
-            'color': '#4ECDC4',
-            'unit': 'm³/s'
-        },
-        'Flow Average (m³/s)': {
-            'columns': ['oct_flow_avg_m3', 'nov_flow_avg_m3', 'dec_flow_avg_m3',
-                       'jan_flow_avg_m3', 'feb_flow_avg_m3', 'mar_flow_avg_m3',
-                       'apr_flow_avg_m3', 'may_flow_avg_m3', 'jun_flow_avg_m3',
-                       'jul_flow_avg_m3', 'aug_flow_avg_m3', 'sep_flow_avg_m3'],
-            'color': '#45B7D1',
-            'unit': 'm³/s'
-        },
-        'Flow per km² (l/s/km²)': {
-            'columns': ['oct_ltsnkm2_m3', 'nov_ltsnkm2_m3', 'dec_ltsnkm2_m3',
-                       'jan_ltsnkm2_m3', 'feb_ltsnkm2_m3', 'mar_ltsnkm2_m3',
-                       'apr_ltsnkm2_m3', 'may_ltsnkm2_m3', 'jun_ltsnkm2_m3',
-                       'jul_ltsnkm2_m3', 'aug_ltsnkm2_m3', 'sep_ltsnkm2_m3'],
-            'color': '#96CEB4',
-            'unit': 'l/s/km²'
-        },
-        'Flow in mm': {
-            'columns': ['oct_akim_mm_m3', 'nov_akim_mm_m3', 'dec_akim_mm_m3',
-                       'jan_akim_mm_m3', 'feb_akim_mm_m3', 'mar_akim_mm_m3',
-                       'apr_akim_mm_m3', 'may_akim_mm_m3', 'jun_akim_mm_m3',
-                       'jul_akim_mm_m3', 'aug_akim_mm_m3', 'sep_akim_mm_m3'],
-            'color': '#FFEAA7',
-            'unit': 'mm'
-        },
-        'Flow in million m³': {
-            'columns': ['oct_milm3_m3', 'nov_milm3_m3', 'dec_milm3_m3',
-                       'jan_milm3_m3', 'feb_milm3_m3', 'mar_milm3_m3',
-                       'apr_milm3_m3', 'may_milm3_m3', 'jun_milm3_m3',
-                       'jul_milm3_m3', 'aug_milm3_m3', 'sep_milm3_m3'],
-            'color': '#DDA0DD',
-            'unit': 'million m³'
-        }
-    }
+    
+    metrics = METRICS
+    
+    # Only read the columns the charts use, monthly values as float32
+    monthly_cols = [col for metric_info in metrics.values() for col in metric_info['columns']]
+    df = pd.read_csv(csv_file, engine='pyarrow',
+                     usecols=['year', 'station_code'] + monthly_cols,
+                     dtype={col: 'float32' for col in monthly_cols})
     
     # Month names for display (starting from October)
-    month_names = ['Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar', 
-                   'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep']
+    month_names = MONTH_NAMES
     
     print(f"Data loaded: {len(df)} records")
     print(f"Years available: {sorted(df['year'].unique())}")
@@ -82,69 +149,118 @@ def load_and_prepare_data(csv_file):
     
     return df, metrics, month_names
 
-def create_monthly_trends_chart(df, metrics, month_names):
+def prepare_aggregates(df, metrics):
+    """Compute every aggregate the charts need in one place"""
+    
+    all_cols = [col for metric_info in metrics.values() for col in metric_info['columns']]
+    
+    # Yearly averages for every monthly column in one compiled pass
+    year_codes, years = pd.factorize(df['year'], sort=True)
+    yearly_mean = pd.DataFrame(
+        groupby_mean(year_codes, df[all_cols].to_numpy(dtype=np.float32), len(years)),
+        index=pd.Index(years, name='year'), columns=all_cols)
+    
+    # Raw (records x 12) monthly values per metric for distribution charts
+    values = {metric_name: df[metric_info['columns']].to_numpy(dtype=np.float32)
+              for metric_name, metric_info in metrics.items()}
+    
+    return {
+        'yearly_mean': yearly_mean,
+        # Per-month mean/std (sample std, as pandas) and pooled per-metric mean/std
+        'monthly_mean_std': {metric_name: column_mean_std(metric_values, 1)
+                             for metric_name, metric_values in values.items()},
+        'metric_mean_std': {metric_name: column_mean_std(metric_values.reshape(-1, 1), 0)
+                            for metric_name, metric_values in values.items()},
+        'corr': {metric_name: pairwise_pearson(metric_values)
+                 for metric_name, metric_values in values.items()},
+        'values': values,
+        'n_records': len(df),
+        'years': np.sort(df['year'].unique()),
+        'n_stations': df['station_code'].nunique()
+    }
+
+def load_prepared_data(csv_file):
+    """Load metrics and aggregates, reusing a pickle when it is newer than the CSV
+    and was written by the same cache version and month/metric schema"""
+    csv_path = Path(csv_file)
+    pickle_path = csv_path.with_suffix('.prepared.pkl')
+    
+    if pickle_path.exists() and pickle_path.stat().st_mtime > csv_path.stat().st_mtime:
+        with open(pickle_path, 'rb') as f:
+            cached = pickle.load(f)
+        if (isinstance(cached, dict) and cached.get('version') == CACHE_VERSION
+                and cached.get('schema') == _SCHEMA_FINGERPRINT):
+            return cached['prepared']
+        print("Cached aggregates are out of date, rebuilding")
+    
+    df, metrics, month_names = load_and_prepare_data(csv_path)
+    prepared = (prepare_aggregates(df, metrics), metrics, month_names)
+    with open(pickle_path, 'wb') as f:
+        pickle.dump({'version': CACHE_VERSION, 'schema': _SCHEMA_FINGERPRINT,
+                     'prepared': prepared}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return prepared
+
+def create_monthly_trends_chart(fig, aggregates, metrics, month_names, save=True):
     """Create monthly trends chart showing changes over years"""
     
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    axes = axes.flatten()
+    fig.clf()
+    fig.set_size_inches(20, 12)
+    axes = fig.subplots(2, 3).flatten()
+    
+    yearly_means = aggregates['yearly_mean']
+    years = yearly_means.index.to_numpy()
     
     for i, (metric_name, metric_info) in enumerate(metrics.items()):
         ax = axes[i]
         
-        # Calculate yearly averages for each month
-        monthly_trends = {}
-        for j, month_col in enumerate(metric_info['columns']):
-            monthly_trends[month_names[j]] = df.groupby('year')[month_col].mean()
-        
-        # Plot trends for each month
-        years = list(monthly_trends.values())[0].index
-        colors = plt.cm.tab20(np.linspace(0, 1, len(month_names)))
-        
-        for j, (month, values) in enumerate(monthly_trends.items()):
-            ax.plot(years, values, 'o-', linewidth=2, markersize=4,
-                   color=colors[j], label=month, alpha=0.8)
+        # Plot trends for each month (one line per column of the years x 12 matrix)
+        ax.set_prop_cycle(color=_MONTH_COLORS)
+        lines = ax.plot(years, yearly_means[metric_info['columns']].to_numpy(),
+                        'o-', linewidth=2, markersize=4, alpha=0.8)
+        for line, month in zip(lines, month_names):
+            line.set_label(month)
         
         ax.set_xlabel('Year', fontsize=10, fontweight='bold')
         ax.set_ylabel(f'{metric_name} ({metric_info["unit"]})', fontsize=10, fontweight='bold')
         ax.set_title(f'{metric_name} - Monthly Trends Over Years', fontsize=12, fontweight='bold')
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
     
-    plt.suptitle('Monthly Data Trends Over Years (2005-2020)', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    # One month legend for all subplots, in a strip kept free on the right
+    handles, labels = axes[0].get_legend_handles_labels()
+    fig.legend(handles, labels, loc='center right', fontsize=8, bbox_to_anchor=(1.0, 0.5))
+    
+    fig.suptitle('Monthly Data Trends Over Years (2005-2020)', fontsize=16, fontweight='bold')
+    fig.tight_layout(rect=(0, 0, 0.95, 1))
     
-    filename = 'monthly_data_trends_chart.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    if save:
+        filename = 'monthly_data_trends_chart.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
-def create_monthly_change_analysis(df, metrics, month_names):
+def create_monthly_change_analysis(fig, aggregates, metrics, month_names, save=True):
     """Create monthly change analysis chart"""
     
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    axes = axes.flatten()
+    fig.clf()
+    fig.set_size_inches(20, 12)
+    axes = fig.subplots(2, 3).flatten()
+    
+    yearly_means = aggregates['yearly_mean']
+    years = yearly_means.index.to_numpy()
     
     for i, (metric_name, metric_info) in enumerate(metrics.items()):
         ax = axes[i]
         
-        # Calculate percentage change from first year for each month
-        monthly_changes = {}
-        first_year = df['year'].min()
-        
-        for j, month_col in enumerate(metric_info['columns']):
-            yearly_means = df.groupby('year')[month_col].mean()
-            first_year_value = yearly_means.iloc[0]
-            percentage_changes = ((yearly_means - first_year_value) / first_year_value) * 100
-            monthly_changes[month_names[j]] = percentage_changes
-        
-        # Plot changes for each month
-        years = list(monthly_changes.values())[0].index
-        colors = plt.cm.tab20(np.linspace(0, 1, len(month_names)))
+        # Percentage change from first year as one (years x 12) broadcast
+        monthly_means = yearly_means[metric_info['columns']].to_numpy()
+        monthly_changes = (monthly_means - monthly_means[0:1]) / monthly_means[0:1] * 100
         
-        for j, (month, changes) in enumerate(monthly_changes.items()):
-            ax.plot(years, changes, 'o-', linewidth=2, markersize=4,
-                   color=colors[j], label=month, alpha=0.8)
+        # Plot changes for each month (one line per column)
+        ax.set_prop_cycle(color=_MONTH_COLORS)
+        lines = ax.plot(years, monthly_changes, 'o-', linewidth=2, markersize=4, alpha=0.8)
+        for line, month in zip(lines, month_names):
+            line.set_label(month)
         
         # Add zero line
         ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
@@ -152,52 +268,44 @@ def create_monthly_change_analysis(df, metrics, month_names):
         ax.set_xlabel('Year', fontsize=10, fontweight='bold')
         ax.set_ylabel('Change from 2005 (%)', fontsize=10, fontweight='bold')
         ax.set_title(f'{metric_name} - Monthly Change Analysis', fontsize=12, fontweight='bold')
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=8)
         ax.grid(True, alpha=0.3)
     
-    plt.suptitle('Monthly Data Change Analysis (2005-2020)', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    # One month legend for all subplots, in a strip kept free on the right
+    handles, labels = axes[0].get_legend_handles_labels()
+    fig.legend(handles, labels, loc='center right', fontsize=8, bbox_to_anchor=(1.0, 0.5))
     
-    filename = 'monthly_data_change_analysis.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    fig.suptitle('Monthly Data Change Analysis (2005-2020)', fontsize=16, fontweight='bold')
+    fig.tight_layout(rect=(0, 0, 0.95, 1))
+    
+    if save:
+        filename = 'monthly_data_change_analysis.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
-def create_seasonal_patterns_chart(df, metrics, month_names):
+def create_seasonal_patterns_chart(fig, aggregates, metrics, month_names, save=True):
     """Create seasonal patterns chart"""
     
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    axes = axes.flatten()
-    
-    # Define seasons
-    seasons = {
-        'Autumn': ['Oct', 'Nov', 'Dec'],
-        'Winter': ['Jan', 'Feb', 'Mar'],
-        'Spring': ['Apr', 'May', 'Jun'],
-        'Summer': ['Jul', 'Aug', 'Sep']
-    }
+    fig.clf()
+    fig.set_size_inches(20, 12)
+    axes = fig.subplots(2, 3).flatten()
     
     for i, (metric_name, metric_info) in enumerate(metrics.items()):
         ax = axes[i]
         
-        # Calculate seasonal averages over years
-        seasonal_data = {}
-        for season, months in seasons.items():
-            season_values = []
-            for month in months:
-                month_idx = month_names.index(month)
-                month_col = metric_info['columns'][month_idx]
-                season_values.extend(df[month_col].dropna().tolist())
-            seasonal_data[season] = season_values
+        # Pool all values of a season's months into one flat array
+        values = aggregates['values'][metric_name]
+        box_data = []
+        for month_idx in SEASON_IDX.values():
+            season_values = values[:, month_idx].ravel()
+            box_data.append(season_values[~np.isnan(season_values)])
         
         # Create box plot for seasonal distribution
-        box_data = [seasonal_data[season] for season in seasons.keys()]
-        bp = ax.boxplot(box_data, tick_labels=list(seasons.keys()), patch_artist=True)
+        bp = ax.boxplot(box_data, tick_labels=list(SEASON_IDX), patch_artist=True)
         
         # Color the boxes
-        colors = ['#FF9999', '#66B3FF', '#99FF99', '#FFCC99']
-        for patch, color in zip(bp['boxes'], colors):
+        for patch, color in zip(bp['boxes'], _SEASON_COLORS):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
         
@@ -206,76 +314,61 @@ def create_seasonal_patterns_chart(df, metrics, month_names):
         ax.set_title(f'{metric_name} - Seasonal Patterns', fontsize=12, fontweight='bold')
         ax.grid(True, alpha=0.3)
     
-    plt.suptitle('Seasonal Patterns in Monthly Data', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Seasonal Patterns in Monthly Data', fontsize=16, fontweight='bold')
+    fig.tight_layout()
     
-    filename = 'monthly_seasonal_patterns_chart.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    if save:
+        filename = 'monthly_seasonal_patterns_chart.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
-def create_monthly_correlation_chart(df, metrics, month_names):
+def create_monthly_correlation_chart(fig, aggregates, metrics, month_names, save=True):
     """Create monthly correlation analysis chart"""
     
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    axes = axes.flatten()
+    fig.clf()
+    fig.set_size_inches(20, 12)
+    axes = fig.subplots(2, 3).flatten()
     
     for i, (metric_name, metric_info) in enumerate(metrics.items()):
         ax = axes[i]
         
-        # Create correlation matrix for months
-        monthly_data = df[metric_info['columns']].copy()
-        monthly_data.columns = month_names
-        correlation_matrix = monthly_data.corr()
-        
-        # Create heatmap
-        im = ax.imshow(correlation_matrix, cmap='coolwarm', aspect='auto', vmin=-1, vmax=1)
+        # Correlation matrix between months
+        correlation_matrix = aggregates['corr'][metric_name]
         
-        # Add correlation values as text
-        for j in range(len(correlation_matrix.columns)):
-            for k in range(len(correlation_matrix.index)):
-                text = ax.text(k, j, f'{correlation_matrix.iloc[j, k]:.2f}',
-                             ha="center", va="center", color="black", fontweight='bold')
-        
-        ax.set_xticks(range(len(correlation_matrix.columns)))
-        ax.set_yticks(range(len(correlation_matrix.index)))
-        ax.set_xticklabels(correlation_matrix.columns, rotation=45)
-        ax.set_yticklabels(correlation_matrix.index)
+        # Create annotated heatmap
+        sns.heatmap(correlation_matrix, annot=True, fmt='.2f', cmap='coolwarm',
+                    vmin=-1, vmax=1, cbar=False, ax=ax,
+                    xticklabels=month_names, yticklabels=month_names,
+                    annot_kws={'fontweight': 'bold'})
+        ax.tick_params(axis='x', labelrotation=45)
         ax.set_title(f'{metric_name} - Monthly Correlations', fontsize=12, fontweight='bold')
     
-    plt.suptitle('Monthly Correlations Within Each Metric', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Monthly Correlations Within Each Metric', fontsize=16, fontweight='bold')
+    fig.tight_layout()
     
-    filename = 'monthly_correlation_analysis.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    if save:
+        filename = 'monthly_correlation_analysis.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
-def create_monthly_variability_chart(df, metrics, month_names):
+def create_monthly_variability_chart(fig, aggregates, metrics, month_names, save=True):
     """Create monthly variability analysis chart"""
     
-    fig, axes = plt.subplots(2, 3, figsize=(20, 12))
-    axes = axes.flatten()
+    fig.clf()
+    fig.set_size_inches(20, 12)
+    axes = fig.subplots(2, 3).flatten()
     
     for i, (metric_name, metric_info) in enumerate(metrics.items()):
         ax = axes[i]
         
         # Calculate coefficient of variation for each month
-        monthly_cv = []
-        monthly_means = []
-        monthly_stds = []
-        
-        for month_col in metric_info['columns']:
-            values = df[month_col].dropna()
-            mean_val = values.mean()
-            std_val = values.std()
-            cv_val = (std_val / mean_val) * 100 if mean_val > 0 else 0
-            
-            monthly_cv.append(cv_val)
-            monthly_means.append(mean_val)
-            monthly_stds.append(std_val)
+        monthly_means, monthly_stds = aggregates['monthly_mean_std'][metric_name]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            monthly_cv = np.where(monthly_means > 0, monthly_stds / monthly_means * 100, 0)
         
         # Create bar chart for coefficient of variation
         x_pos = np.arange(len(month_names))
@@ -289,39 +382,41 @@ def create_monthly_variability_chart(df, metrics, month_names):
         ax.grid(True, alpha=0.3)
         
         # Add value labels on bars
-        for bar, cv in zip(bars, monthly_cv):
-            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5,
-                   f'{cv:.1f}%', ha='center', va='bottom', fontsize=9, fontweight='bold')
+        ax.bar_label(bars, labels=[f'{cv:.1f}%' for cv in monthly_cv],
+                     padding=3, fontsize=9, fontweight='bold')
     
-    plt.suptitle('Monthly Variability Analysis (Coefficient of Variation)', fontsize=16, fontweight='bold')
-    plt.tight_layout()
+    fig.suptitle('Monthly Variability Analysis (Coefficient of Variation)', fontsize=16, fontweight='bold')
+    fig.tight_layout()
     
-    filename = 'monthly_variability_analysis.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    if save:
+        filename = 'monthly_variability_analysis.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
-def create_monthly_summary_chart(df, metrics, month_names):
+def create_monthly_summary_chart(fig, aggregates, metrics, month_names, save=True):
     """Create monthly summary statistics chart"""
     
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig.clf()
+    fig.set_size_inches(16, 10)
+    ax = fig.subplots()
     
     # Calculate overall statistics for each metric
     stats_data = []
     for metric_name, metric_info in metrics.items():
-        all_values = []
-        for col in metric_info['columns']:
-            all_values.extend(df[col].dropna().tolist())
-        
-        values_array = np.array(all_values)
+        # NaN-aware reductions directly on the (records x 12) matrix
+        values_array = aggregates['values'][metric_name]
+        metric_mean, metric_std = aggregates['metric_mean_std'][metric_name]
+        mean_val = metric_mean[0]
+        std_val = metric_std[0]
         stats_data.append({
             'Metric': metric_name,
-            'Mean': values_array.mean(),
-            'Std': values_array.std(),
-            'Min': values_array.min(),
-            'Max': values_array.max(),
-            'CV': (values_array.std() / values_array.mean()) * 100 if values_array.mean() > 0 else 0
+            'Mean': mean_val,
+            'Std': std_val,
+            'Min': np.nanmin(values_array),
+            'Max': np.nanmax(values_array),
+            'CV': (std_val / mean_val) * 100 if mean_val > 0 else 0
         })
     
     stats_df = pd.DataFrame(stats_data)
@@ -338,16 +433,15 @@ def create_monthly_summary_chart(df, metrics, month_names):
     ax.grid(True, alpha=0.3)
     
     # Add value labels
-    for i, (bar, cv) in enumerate(zip(bars, stats_df['CV'])):
-        ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-               f'{cv:.1f}%', ha='left', va='center', fontweight='bold')
+    ax.bar_label(bars, labels=[f'{cv:.1f}%' for cv in stats_df['CV']],
+                 padding=3, fontweight='bold')
     
     # Add statistics text box
     stats_text = f"""Monthly Data Summary:
     
-Total Records: {len(df)}
-Years: {df['year'].min()}-{df['year'].max()} ({df['year'].nunique()} years)
-Stations: {df['station_code'].nunique()}
+Total Records: {aggregates['n_records']}
+Years: {aggregates['years'][0]}-{aggregates['years'][-1]} ({len(aggregates['years'])} years)
+Stations: {aggregates['n_stations']}
 Months per Metric: 12
 
 Most Variable Metric: {stats_df.loc[stats_df['CV'].idxmax(), 'Metric']}
@@ -357,48 +451,61 @@ Least Variable Metric: {stats_df.loc[stats_df['CV'].idxmin(), 'Metric']}"""
             verticalalignment='top', fontsize=10, fontfamily='monospace',
             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    filename = 'monthly_data_summary_statistics.png'
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
-    print(f"Created chart: {filename}")
+    if save:
+        filename = 'monthly_data_summary_statistics.png'
+        fig.savefig(filename, dpi=150)
+        print(f"Created chart: {filename}")
     
     return fig
 
+# Figure reused by every chart a worker process draws (cleared per chart)
+_worker_fig = None
+
+def run_chart(chart_func, aggregates, metrics, month_names):
+    """Create and save one chart on this process's shared figure (pool worker entry point)"""
+    global _worker_fig
+    if _worker_fig is None:
+        _worker_fig = plt.figure(figsize=(20, 12))
+    chart_func(_worker_fig, aggregates, metrics, month_names)
+
 def main():
     """Main function to create all monthly data change charts"""
     
     csv_file = 'dsi_2000_2020_final_structured_FILLED.csv'
     
     print("Loading data...")
-    df, metrics, month_names = load_and_prepare_data(csv_file)
+    aggregates, metrics, month_names = load_prepared_data(csv_file)
     
     print(f"\nCreating charts for {len(metrics)} monthly metrics...")
     
-    # Create all charts
-    print("\n1. Creating monthly trends chart...")
-    fig1 = create_monthly_trends_chart(df, metrics, month_names)
-    plt.close(fig1)
-    
-    print("\n2. Creating monthly change analysis chart...")
-    fig2 = create_monthly_change_analysis(df, metrics, month_names)
-    plt.close(fig2)
-    
-    print("\n3. Creating seasonal patterns chart...")
-    fig3 = create_seasonal_patterns_chart(df, metrics, month_names)
-    plt.close(fig3)
-    
-    print("\n4. Creating monthly correlation chart...")
-    fig4 = create_monthly_correlation_chart(df, metrics, month_names)
-    plt.close(fig4)
-    
-    print("\n5. Creating monthly variability chart...")
-    fig5 = create_monthly_variability_chart(df, metrics, month_names)
-    plt.close(fig5)
-    
-    print("\n6. Creating monthly summary chart...")
-    fig6 = create_monthly_summary_chart(df, metrics, month_names)
-    plt.close(fig6)
+    chart_funcs = [
+        create_monthly_trends_chart,
+        create_monthly_change_analysis,
+        create_seasonal_patterns_chart,
+        create_monthly_correlation_chart,
+        create_monthly_variability_chart,
+        create_monthly_summary_chart
+    ]
+    
+    if "--png" in sys.argv[1:]:
+        # Separate PNGs: charts are independent, so render them in parallel
+        # worker processes; a worker handling several charts reuses one figure
+        n_workers = min(len(chart_funcs), os.cpu_count() or 1)
+        with get_context('spawn').Pool(n_workers) as pool:
+            pool.starmap(run_chart, [(chart_func, aggregates, metrics, month_names)
+                                     for chart_func in chart_funcs])
+    else:
+        # Default: one vector PDF with a page per chart, drawn on a single figure
+        pdf_file = 'monthly_data_changes_charts.pdf'
+        fig = plt.figure(figsize=(20, 12))
+        with PdfPages(pdf_file) as pdf:
+            for chart_func in chart_funcs:
+                chart_func(fig, aggregates, metrics, month_names, save=False)
+                pdf.savefig(fig)
+        plt.close(fig)
+        print(f"Created charts: {pdf_file}")
     
     print(f"\n[SUCCESS] All monthly data change charts created successfully!")
     print(f"[CHARTS] Generated 6 comprehensive charts:")
@@ -408,7 +515,8 @@ def main():
     print(f"  - Monthly correlation chart")
     print(f"  - Monthly variability chart")
     print(f"  - Monthly summary statistics chart")
-    print(f"[DATA] Analysis covers {df['year'].nunique()} years ({df['year'].min()}-{df['year'].max()})")
+    years = aggregates['years']
+    print(f"[DATA] Analysis covers {len(years)} years ({years[0]}-{years[-1]})")
     print(f"[METRICS] {len(metrics)} monthly metrics analyzed")
 
 if __name__ == "__main__":
@@ -3,9 +3,11 @@
 Create stations comparison chart with overall trend line showing average flow change
 """
 
+import gc
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import seaborn as sns
 
 def create_stations_comparison_with_overall_trend():
@@ -15,7 +17,11 @@ def create_stations_comparison_with_overall_trend():
     csv_file = "dsi_2000_2020_final_structured_STD_CORRECTED.csv"
     
     try:
-        df = pd.read_csv(csv_file)
+        try:
+            df = pd.read_csv(csv_file, engine='pyarrow')
+        except ImportError:
+            # pyarrow not installed; use the default C parser
+            df = pd.read_csv(csv_file)
         print(f"Successfully loaded {len(df)} records from {csv_file}")
     except FileNotFoundError:
         print(f"Error: File {csv_file} not found!")
@@ -26,10 +32,12 @@ def create_stations_comparison_with_overall_trend():
     
     # Filter out records with missing annual_avg_flow_m3s
     df_flow = df[df['annual_avg_flow_m3s'].notna()]
+    del df  # only the filtered frame is used from here on
     print(f"Records with valid annual_avg_flow_m3s: {len(df_flow)}")
     
-    # Get unique stations and their data counts
-    stations = df_flow['station_code'].unique()
+    # Get unique stations and their data counts (missing codes dropped, matching
+    # the groupby keys used for plotting)
+    stations = df_flow['station_code'].dropna().unique()
     print(f"Found {len(stations)} unique stations")
     
     # Count data points per station
@@ -39,8 +47,17 @@ def create_stations_comparison_with_overall_trend():
         print(f"  {station}: {count} records")
     
     # Calculate overall yearly averages
-    yearly_avg = df_flow.groupby('year')['annual_avg_flow_m3s'].agg(['mean', 'std', 'count']).reset_index()
-    yearly_avg = yearly_avg.sort_values('year')
+    # (one sort by year, then segment sums with np.add.reduceat)
+    order = np.argsort(df_flow['year'].to_numpy(), kind='stable')
+    y = df_flow['year'].to_numpy()[order]
+    v = df_flow['annual_avg_flow_m3s'].to_numpy(dtype=float)[order]
+    edges = np.concatenate(([0], np.flatnonzero(np.diff(y)) + 1))
+    n = np.diff(np.append(edges, len(y)))
+    mean = np.add.reduceat(v, edges) / n
+    dev = v - np.repeat(mean, n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(np.add.reduceat(dev * dev, edges) / (n - 1))  # sample std as pandas
+    yearly_avg = pd.DataFrame({'year': y[edges], 'mean': mean, 'std': std, 'count': n})
     
     print(f"\nOverall yearly averages calculated for {len(yearly_avg)} years")
     print("Year | Mean Flow | Std Dev | Count")
@@ -49,52 +66,62 @@ def create_stations_comparison_with_overall_trend():
         print(f"{row['year']:.0f} | {row['mean']:.3f} | {row['std']:.3f} | {row['count']:>5}")
     
     # Create the main comparison chart
-    plt.figure(figsize=(18, 12))
+    fig, ax = plt.subplots(figsize=(18, 12))
     
     # Define colors for different stations
     colors = plt.cm.Set3(np.linspace(0, 1, len(stations)))
     
-    # Plot each station (lighter colors)
+    # Plot each station (lighter colors): all station lines as one collection,
+    # all station markers as one scatter (single-point stations get larger dots)
+    segments, segment_colors = [], []
+    point_xy, point_colors, point_sizes = [], [], []
+    # One sort + groupby pass; groups are looked up in legend (first-seen) order
+    station_groups = dict(tuple(df_flow.sort_values('year', kind='stable')
+                                .groupby('station_code', sort=False)))
     for i, station in enumerate(stations):
-        station_data = df_flow[df_flow['station_code'] == station].copy()
-        station_data = station_data.sort_values('year')
+        station_data = station_groups[station]
+        xy = station_data[['year', 'annual_avg_flow_m3s']].to_numpy(dtype=float)
         
         if len(station_data) >= 2:
-            plt.plot(station_data['year'], station_data['annual_avg_flow_m3s'], 
-                     marker='o', linewidth=1.5, markersize=4,
-                     color=colors[i], alpha=0.6, 
-                     markerfacecolor=colors[i], 
-                     markeredgecolor='white', markeredgewidth=0.5)
-        else:
-            plt.scatter(station_data['year'], station_data['annual_avg_flow_m3s'], 
-                       color=colors[i], s=60, alpha=0.6, marker='o', 
-                       edgecolor='white', linewidth=0.5)
+            segments.append(xy)
+            segment_colors.append(colors[i])
+        point_xy.append(xy)
+        point_colors.extend([colors[i]] * len(xy))
+        point_sizes.extend([16 if len(xy) >= 2 else 60] * len(xy))
+    
+    ax.add_collection(LineCollection(segments, colors=segment_colors, 
+                                     linewidths=1.5, alpha=0.6))
+    point_xy = np.concatenate(point_xy)
+    ax.scatter(point_xy[:, 0], point_xy[:, 1], c=point_colors, s=point_sizes, 
+               alpha=0.6, marker='o', edgecolor='white', linewidth=0.5)
+    ax.autoscale_view()
     
     # Plot overall trend line (bold and prominent)
-    plt.plot(yearly_avg['year'], yearly_avg['mean'], 
-             marker='s', linewidth=4, markersize=8,
-             color='red', label='Overall Average Trend',
-             markerfacecolor='red', markeredgecolor='white', 
-             markeredgewidth=2, alpha=0.9)
+    ax.plot(yearly_avg['year'], yearly_avg['mean'], 
+            marker='s', linewidth=4, markersize=8,
+            color='red', label='Overall Average Trend',
+            markerfacecolor='red', markeredgecolor='white', 
+            markeredgewidth=2, alpha=0.9)
     
     # Add error bars for overall trend
-    plt.errorbar(yearly_avg['year'], yearly_avg['mean'], 
+    ax.errorbar(yearly_avg['year'], yearly_avg['mean'], 
                 yerr=yearly_avg['std'], fmt='none', 
                 color='red', capsize=5, capthick=2, alpha=0.7)
     
-    # Add trend line for overall average
+    # Add trend line for overall average (coefficients reused by the analysis chart)
+    z = None
     if len(yearly_avg) > 1:
         z = np.polyfit(yearly_avg['year'], yearly_avg['mean'], 1)
         p = np.poly1d(z)
-        plt.plot(yearly_avg['year'], p(yearly_avg['year']), 
-                 "--", color='darkred', linewidth=3, alpha=0.8,
-                 label=f'Linear Trend: {z[0]:.4f} m³/s/year')
+        ax.plot(yearly_avg['year'], p(yearly_avg['year']), 
+                "--", color='darkred', linewidth=3, alpha=0.8,
+                label=f'Linear Trend: {z[0]:.4f} m³/s/year')
     
     # Customize the chart
-    plt.title('All Stations - Annual Flow Changes Comparison\nWith Overall Average Trend Line', 
-              fontsize=18, fontweight='bold', pad=25)
-    plt.xlabel('Year', fontsize=14, fontweight='bold')
-    plt.ylabel('Annual Average Flow (m³/s)', fontsize=14, fontweight='bold')
+    ax.set_title('All Stations - Annual Flow Changes Comparison\nWith Overall Average Trend Line', 
+                 fontsize=18, fontweight='bold', pad=25)
+    ax.set_xlabel('Year', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Annual Average Flow (m³/s)', fontsize=14, fontweight='bold')
     
     # Add legend with better positioning
     legend_elements = []
@@ -107,18 +134,17 @@ def create_stations_comparison_with_overall_trend():
     legend_elements.append(plt.Line2D([0], [0], color='red', lw=4, 
                                     label='Overall Average Trend'))
     
-    plt.legend(handles=legend_elements, bbox_to_anchor=(1.05, 1), 
-               loc='upper left', fontsize=9, frameon=True, 
-               fancybox=True, shadow=True)
+    ax.legend(handles=legend_elements, bbox_to_anchor=(1.05, 1), 
+              loc='upper left', fontsize=9, frameon=True, 
+              fancybox=True, shadow=True)
     
     # Add grid
-    plt.grid(True, alpha=0.3, linestyle='--')
+    ax.grid(True, alpha=0.3, linestyle='--')
     
     # Set background color
-    plt.gca().set_facecolor('#fafafa')
+    ax.set_facecolor('#fafafa')
     
     # Clean spines
-    ax = plt.gca()
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     ax.spines['left'].set_color('#666666')
@@ -132,24 +158,29 @@ Overall Mean: {df_flow['annual_avg_flow_m3s'].mean():.3f} m³/s
 Overall Std Dev: {df_flow['annual_avg_flow_m3s'].std():.3f} m³/s
 Flow Range: {df_flow['annual_avg_flow_m3s'].min():.3f} - {df_flow['annual_avg_flow_m3s'].max():.3f} m³/s"""
     
-    plt.text(0.02, 0.98, overall_stats, transform=ax.transAxes, 
-             verticalalignment='top', fontsize=11,
-             bbox=dict(boxstyle='round', facecolor='white', alpha=0.9, 
+    ax.text(0.02, 0.98, overall_stats, transform=ax.transAxes, 
+            verticalalignment='top', fontsize=11,
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.9, 
                       edgecolor='red', linewidth=2))
     
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save the chart
     output_path = "stations_comparison_with_overall_trend.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
     print(f"\nComparison chart with overall trend saved to: {output_path}")
     
-    # Show the chart
     plt.show()
     
+    # Release the figure and the intermediates it was built from
+    plt.close(fig)
+    del fig, ax, legend_elements, station_counts, station_groups
+    del segments, segment_colors, point_xy, point_colors, point_sizes
+    gc.collect()
+    
     # Create additional analysis chart showing overall trend more clearly
-    create_overall_trend_analysis_chart(yearly_avg, df_flow)
+    create_overall_trend_analysis_chart(yearly_avg, df_flow, trend_coef=z)
     
     # Create summary statistics
     print("\n=== STATION SUMMARY STATISTICS ===")
@@ -165,8 +196,8 @@ Flow Range: {df_flow['annual_avg_flow_m3s'].min():.3f} - {df_flow['annual_avg_fl
     
     return summary_stats, yearly_avg
 
-def create_overall_trend_analysis_chart(yearly_avg, df_flow):
-    """Create a focused chart showing the overall trend analysis"""
+def create_overall_trend_analysis_chart(yearly_avg, df_flow, trend_coef=None):
+    """Create a focused chart showing the overall trend analysis (trend_coef: precomputed polyfit)"""
     
     fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 12))
     
@@ -184,8 +215,10 @@ def create_overall_trend_analysis_chart(yearly_avg, df_flow):
                     alpha=0.3, color='red', label='±1 Standard Deviation')
     
     # Add trend line
-    if len(yearly_avg) > 1:
-        z = np.polyfit(yearly_avg['year'], yearly_avg['mean'], 1)
+    if trend_coef is None and len(yearly_avg) > 1:
+        trend_coef = np.polyfit(yearly_avg['year'], yearly_avg['mean'], 1)
+    if trend_coef is not None:
+        z = trend_coef
         p = np.poly1d(z)
         ax1.plot(yearly_avg['year'], p(yearly_avg['year']), 
                  "--", color='darkred', linewidth=3, alpha=0.8,
@@ -198,18 +231,17 @@ def create_overall_trend_analysis_chart(yearly_avg, df_flow):
     ax1.legend(fontsize=11)
     ax1.grid(True, alpha=0.3, linestyle='--')
     
-    # Add value labels
-    for i, row in yearly_avg.iterrows():
-        ax1.annotate(f'{row["mean"]:.2f}', 
-                    (row['year'], row['mean']),
-                    textcoords="offset points", xytext=(0,15), 
-                    ha='center', fontsize=10, fontweight='bold',
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
-                            alpha=0.8, edgecolor='red', linewidth=1))
+    # Add value labels (shared style, positions taken straight from the arrays)
+    label_style = dict(textcoords="offset points", xytext=(0,15), 
+                       ha='center', fontsize=10, fontweight='bold',
+                       bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
+                                 alpha=0.8, edgecolor='red', linewidth=1))
+    for year, mean in zip(yearly_avg['year'].to_numpy(), yearly_avg['mean'].to_numpy()):
+        ax1.annotate(f'{mean:.2f}', (year, mean), **label_style)
     
     # Chart 2: Number of stations contributing to each year
-    ax2.bar(yearly_avg['year'], yearly_avg['count'], 
-            alpha=0.7, color='skyblue', edgecolor='navy', linewidth=1)
+    bars = ax2.bar(yearly_avg['year'], yearly_avg['count'], 
+                   alpha=0.7, color='skyblue', edgecolor='navy', linewidth=1)
     
     ax2.set_title('Number of Stations Contributing to Each Year', 
                   fontsize=16, fontweight='bold', pad=20)
@@ -218,9 +250,7 @@ def create_overall_trend_analysis_chart(yearly_avg, df_flow):
     ax2.grid(True, alpha=0.3, linestyle='--')
     
     # Add count labels on bars
-    for i, row in yearly_avg.iterrows():
-        ax2.text(row['year'], row['count'] + 0.1, f'{int(row["count"])}', 
-                ha='center', va='bottom', fontweight='bold', fontsize=10)
+    ax2.bar_label(bars, fmt='%d', padding=3, fontweight='bold', fontsize=10)
     
     # Clean spines
     for ax in [ax1, ax2]:
@@ -229,14 +259,16 @@ def create_overall_trend_analysis_chart(yearly_avg, df_flow):
         ax.spines['left'].set_color('#666666')
         ax.spines['bottom'].set_color('#666666')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save the chart
     output_path = "overall_trend_analysis.png"
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    fig.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
     print(f"\nOverall trend analysis chart saved to: {output_path}")
     
     plt.show()
+    plt.close(fig)
+    gc.collect()
 
 if __name__ == "__main__":
     print("Creating stations comparison chart with overall trend...")
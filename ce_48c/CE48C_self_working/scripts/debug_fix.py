@@ -7,6 +7,28 @@ import pandas as pd
 import numpy as np
 import shutil
 
+MONTHS = ['oct', 'nov', 'dec', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep']
+METRICS = ['flow_max_m3', 'flow_min_m3', 'flow_avg_m3', 'ltsnkm2_m3', 'akim_mm_m3', 'milm3_m3']
+
+def shift_empty_october(df, metrics=METRICS, months=MONTHS):
+    """Shift every row/metric with an empty October one month right; returns rows shifted per metric"""
+    all_cols = [f"{month}_{metric}" for metric in metrics for month in months]
+    A = df[all_cols].to_numpy(dtype=float, copy=True).reshape(len(df), len(metrics), len(months))
+    
+    # Rows whose October is empty: [oct, nov, dec, ...] -> [NaN, oct, nov, dec, ...]
+    mask = np.isnan(A[:, :, 0])
+    shifted = np.concatenate((np.full(A.shape[:2] + (1,), np.nan), A[:, :, :-1]), axis=2)
+    A = np.where(mask[:, :, None], shifted, A)
+    
+    # Fill September with average of (shifted) October and December where both exist
+    oct_vals = A[:, :, 0]
+    dec_vals = A[:, :, 2]
+    has_both = mask & np.isfinite(oct_vals) & np.isfinite(dec_vals)
+    A[:, :, -1] = np.where(has_both, 0.5 * (oct_vals + dec_vals), A[:, :, -1])
+    
+    df[all_cols] = A.reshape(len(df), -1)
+    return dict(zip(metrics, mask.sum(axis=0).tolist()))
+
 def debug_and_fix():
     # Create backup first
     original_file = "dsi_2000_2020_final_structured_UPDATED.csv"
@@ -19,60 +41,19 @@ def debug_and_fix():
     df = pd.read_csv(original_file)
     print(f"Loaded {len(df)} records")
     
-    # Let's focus on one specific case first - row 0, flow_max_m3
+    # Show row 0, flow_max_m3 before the fix as a spot check
     print("\n=== DEBUGGING ROW 0, flow_max_m3 ===")
     row_idx = 0
-    metric = 'flow_max_m3'
-    months = ['oct', 'nov', 'dec', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep']
-    
-    # Get current values
-    current_values = []
-    for month in months:
-        col = f"{month}_{metric}"
-        val = df.iloc[row_idx][col]
-        current_values.append(val)
-        print(f"{col}: {val}")
-    
-    print(f"\nCurrent values: {current_values}")
-    
-    # Check if October is empty
-    oct_val = current_values[0]
-    print(f"October value: {oct_val}, Is NaN: {pd.isna(oct_val)}")
+    check_cols = [f"{month}_flow_max_m3" for month in MONTHS]
+    print(f"Current values: {df.loc[row_idx, check_cols].to_numpy(dtype=float).tolist()}")
     
-    if pd.isna(oct_val):
-        print("October is empty - shifting data...")
-        
-        # Shift right: [oct, nov, dec, ...] -> [NaN, oct, nov, dec, ...]
-        shifted_values = [np.nan] + current_values[:-1]
-        print(f"Shifted values: {shifted_values}")
-        
-        # Fill September with average of October and December
-        oct_val_shifted = shifted_values[0]  # November data
-        dec_val_shifted = shifted_values[2]   # January data
-        print(f"October (has November data): {oct_val_shifted}")
-        print(f"December (has January data): {dec_val_shifted}")
-        
-        if not pd.isna(oct_val_shifted) and not pd.isna(dec_val_shifted):
-            avg_val = (oct_val_shifted + dec_val_shifted) / 2
-            shifted_values[-1] = avg_val
-            print(f"September filled with average: {avg_val}")
-        else:
-            print("Cannot calculate average - one or both values are NaN")
-        
-        print(f"Final shifted values: {shifted_values}")
-        
-        # Apply the fix to the DataFrame
-        for i, month in enumerate(months):
-            col = f"{month}_{metric}"
-            df.at[row_idx, col] = shifted_values[i]
-        
-        print("Applied fix to DataFrame")
+    # Apply the shift to all rows and metrics in one numpy pass
+    for metric, n_shifted in shift_empty_october(df).items():
+        print(f"{metric}: shifted {n_shifted} rows with empty October")
     
     # Verify the fix
     print(f"\nAfter fix - Row 0, flow_max_m3:")
-    for month in months:
-        col = f"{month}_{metric}"
-        val = df.iloc[row_idx][col]
+    for col, val in zip(check_cols, df.loc[row_idx, check_cols].to_numpy()):
         print(f"{col}: {val}")
     
     # Save the corrected file
@@ -9,8 +9,10 @@ import os
 import re
 import csv
 import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+from numba import njit
 from typing import Dict, List, Optional, Tuple
 import logging
 
@@ -25,6 +27,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Plain text extraction without ligature glyphs (keeps "fi"/"fl" as separate letters)
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+@njit(cache=True)
+def parse_numbers(line, n_values=12):
+    """Parse runs of [0-9.,] in a line (comma as decimal point); returns the first
+    n_values numbers (NaN where a run is not a valid number), the run count and
+    whether every value is exact (False if a run has more than 15 digits)"""
+    values = np.full(n_values, np.nan)
+    count = 0
+    exact = True
+    i = 0
+    n = len(line)
+    while i < n:
+        c = line[i]
+        if not ('0' <= c <= '9' or c == '.' or c == ','):
+            i += 1
+            continue
+        mantissa = 0.0
+        digits = 0
+        frac_digits = 0
+        separators = 0
+        while i < n:
+            c = line[i]
+            if '0' <= c <= '9':
+                mantissa = mantissa * 10.0 + (ord(c) - 48)
+                digits += 1
+                if separators:
+                    frac_digits += 1
+            elif c == '.' or c == ',':
+                separators += 1
+            else:
+                break
+            i += 1
+        if count < n_values and digits > 0 and separators <= 1:
+            # Exact (correctly rounded) while the digits fit in the float mantissa
+            values[count] = mantissa / 10.0 ** frac_digits
+            if digits > 15:
+                exact = False
+        count += 1
+    return values, count, exact
+
 class DSIFinalExtractor:
     def __init__(self, pdf_directory: str, output_file: str):
         self.pdf_directory = pdf_directory
@@ -35,6 +79,9 @@ class DSIFinalExtractor:
             'D22A106', 'D22A158', 'E22A054', 'D22A116', 'E22A065'
         }
         
+        # Station code prefixes (D14A, D22A, E22A) used to skip pages cheaply
+        self.station_prefixes = sorted({code[:4] for code in self.target_stations})
+        
         # English month order (water year: Oct to Sep)
         self.months = ["oct", "nov", "dec", "jan", "feb", "mar", 
                       "apr", "may", "jun", "jul", "aug", "sep"]
@@ -52,6 +99,27 @@ class DSIFinalExtractor:
             'milm3': ['MİL. M3', 'MIL. M3']
         }
         
+        # Compiled regex patterns, reused across all lines and pages
+        self.station_code_pattern = re.compile(r'[A-Z]\d{2}[A-Z]\d{3}')
+        self.coordinate_pattern = re.compile(r'\d+°\d+\'\d+"\s*(?:Doğu|Kuzey|DOĞU|KUZEY)', re.IGNORECASE)
+        self.number_pattern = re.compile(r'[\d.]+')
+        self.line_numbers_pattern = re.compile(r'[\d.,]+')
+        self.annual_total_pattern = re.compile(r'SU\s*YILI.*?YILLIK\s*TOPLAM\s*AKIM.*?(\d+[.,]\d+)\s*MİLYON\s*M3', re.IGNORECASE)
+        self.mm_total_pattern = re.compile(r'(\d+[.,]?\d*)\s*MM\.')
+        self.avg_ltsnkm2_pattern = re.compile(r'(\d+[.,]?\d*)\s*LT/SN/Km2')
+        self.year_pattern = re.compile(r'(\d{4})')
+        
+        # One alternation over all metric keywords; the named group gives the metric
+        self.metric_pattern = re.compile('|'.join(
+            f"(?P<{metric}>{'|'.join(map(re.escape, keywords))})"
+            for metric, keywords in self.metric_keywords.items()))
+        
+        # Annual average flow pattern depends on the year; compiled once per year
+        self.annual_avg_flow_patterns = {}
+        
+        # Rows waiting to be written by flush()
+        self._pending_rows = []
+        
         # Initialize CSV with exact headers as specified
         self._initialize_csv()
         
@@ -76,35 +144,45 @@ class DSIFinalExtractor:
         logger.info(f"[OK] Initialized CSV file: {self.output_file}")
         logger.info(f"Total columns: {len(headers)} (11 metadata + {len(self.metrics) * len(self.months)} monthly)")
     
+    # Turkish decimal comma -> dot, spaces removed, in one translate call
+    _NUMBER_TRANS = str.maketrans({',': '.', ' ': None})
+    
     def _normalize_number(self, text: str) -> Optional[float]:
         """Convert Turkish number format to float"""
-        if not text or text.strip() == '':
+        if not text:
             return None
         
         # Remove extra spaces and normalize Turkish decimal separators
-        text = text.strip().replace(',', '.').replace(' ', '')
+        text = text.strip().translate(self._NUMBER_TRANS)
+        if not text:
+            return None
+        
+        # Fast path: the whole string is already a plain decimal number
+        if text.replace('.', '', 1).isdigit():
+            try:
+                return float(text)
+            except ValueError:
+                pass
         
         # Extract number using regex
-        numbers = re.findall(r'[\d.]+', text)
-        if numbers:
+        match = self.number_pattern.search(text)
+        if match:
             try:
-                return float(numbers[0])
+                return float(match.group(0))
             except ValueError:
                 return None
         return None
     
     def _extract_station_code(self, text: str) -> Optional[str]:
         """Extract station code from text"""
-        pattern = r'[A-Z]\d{2}[A-Z]\d{3}'
-        matches = re.findall(pattern, text)
+        matches = self.station_code_pattern.findall(text)
         if matches:
             return matches[0]
         return None
     
     def _extract_coordinates(self, text: str) -> Optional[str]:
         """Extract coordinates from text"""
-        pattern = r'\d+°\d+\'\d+"\s*(?:Doğu|Kuzey|DOĞU|KUZEY)'
-        matches = re.findall(pattern, text, re.IGNORECASE)
+        matches = self.coordinate_pattern.findall(text)
         if len(matches) >= 2:
             return ' '.join(matches[:2])
         return None
@@ -117,52 +195,52 @@ class DSIFinalExtractor:
     
     def _extract_annual_avg_flow(self, text: str, year: int) -> Optional[float]:
         """Extract annual average flow for specific year"""
-        year_pattern = rf'{year}\s*Su\s*yılında.*?(\d+[.,]\d+)\s*m3/sn'
-        matches = re.findall(year_pattern, text, re.IGNORECASE)
+        year_pattern = self.annual_avg_flow_patterns.get(year)
+        if year_pattern is None:
+            year_pattern = re.compile(rf'{year}\s*Su\s*yılında.*?(\d+[.,]\d+)\s*m3/sn', re.IGNORECASE)
+            self.annual_avg_flow_patterns[year] = year_pattern
+        matches = year_pattern.findall(text)
         if matches:
             return self._normalize_number(matches[0])
         return None
     
-    def _extract_monthly_data_structured(self, text: str) -> Dict[str, Dict[str, float]]:
-        """Extract monthly data with structured parsing"""
+    def _extract_monthly_data_structured(self, lines: List[str]) -> Dict[str, Dict[str, float]]:
+        """Extract monthly data with structured parsing from the page lines"""
         monthly_data = {}
         
-        # Split text into lines
-        lines = text.split('\n')
-        
         # Find lines with metric keywords
         for line in lines:
             # Check if this line contains a metric keyword
-            current_metric = None
-            for metric, keywords in self.metric_keywords.items():
-                if any(keyword in line for keyword in keywords):
-                    current_metric = metric
-                    break
-            
-            if not current_metric:
+            metric_match = self.metric_pattern.search(line)
+            if not metric_match:
                 continue
+            current_metric = metric_match.lastgroup
             
             logger.info(f"Processing {current_metric} line: {line[:100]}...")
             
             # Extract numbers from this line - should have exactly 12 values
-            numbers = re.findall(r'[\d.,]+', line)
+            values, n_numbers, exact = parse_numbers(line, len(self.months))
             
-            if len(numbers) >= 12:  # Should have 12 monthly values
-                logger.info(f"Found {len(numbers)} values for {current_metric}")
+            if n_numbers >= 12:  # Should have 12 monthly values
+                logger.info(f"Found {n_numbers} values for {current_metric}")
+                
+                if exact:
+                    month_values = [None if np.isnan(v) else float(v) for v in values]
+                else:
+                    # Very long digit runs: parse with the regex path for exact floats
+                    numbers = self.line_numbers_pattern.findall(line)
+                    month_values = [self._normalize_number(n) for n in numbers[:len(self.months)]]
                 
                 # Map values to months (Oct-Sep order)
-                for j, month in enumerate(self.months):
-                    if j < len(numbers):
-                        value = self._normalize_number(numbers[j])
-                        
-                        if month not in monthly_data:
-                            monthly_data[month] = {}
-                        monthly_data[month][current_metric] = value
-                        
-                        if value is not None:
-                            logger.debug(f"  {month}: {value}")
+                for month, value in zip(self.months, month_values):
+                    if month not in monthly_data:
+                        monthly_data[month] = {}
+                    monthly_data[month][current_metric] = value
+                    
+                    if value is not None:
+                        logger.debug(f"  {month}: {value}")
             else:
-                logger.warning(f"Only found {len(numbers)} values for {current_metric}, expected 12")
+                logger.warning(f"Only found {n_numbers} values for {current_metric}, expected 12")
         
         return monthly_data
     
@@ -173,17 +251,13 @@ class DSIFinalExtractor:
         avg_ltsnkm2 = None
         
         # Extract annual total
-        annual_pattern = r'SU\s*YILI.*?YILLIK\s*TOPLAM\s*AKIM.*?(\d+[.,]\d+)\s*MİLYON\s*M3'
-        matches = re.findall(annual_pattern, text, re.IGNORECASE)
+        matches = self.annual_total_pattern.findall(text)
         if matches:
             annual_total = self._normalize_number(matches[0])
         
         # Extract mm total and avg ltsnkm2
-        mm_pattern = r'(\d+[.,]?\d*)\s*MM\.'
-        ltsnkm2_pattern = r'(\d+[.,]?\d*)\s*LT/SN/Km2'
-        
-        mm_matches = re.findall(mm_pattern, text)
-        ltsnkm2_matches = re.findall(ltsnkm2_pattern, text)
+        mm_matches = self.mm_total_pattern.findall(text)
+        ltsnkm2_matches = self.avg_ltsnkm2_pattern.findall(text)
         
         if mm_matches:
             mm_total = self._normalize_number(mm_matches[-1])  # Take last occurrence
@@ -194,19 +268,20 @@ class DSIFinalExtractor:
     
     def _extract_station_data_structured(self, page_text: str, page_num: int, filename: str, year: int) -> Optional[Dict]:
         """Extract all station data with structured approach"""
-        lines = page_text.split('\n')
-        
-        # Look for station code in every 2nd row (as specified)
+        # Look for a target station code in the page header (first ~2 KB)
         station_code = None
         station_name = None
         
-        for i in range(0, min(20, len(lines)), 2):  # Check every 2nd row, first 20 lines
-            line = lines[i]
-            code = self._extract_station_code(line)
-            if code and code in self.target_stations:
+        for match in self.station_code_pattern.finditer(page_text, 0, 2048):
+            code = match.group(0)
+            if code in self.target_stations:
                 station_code = code
-                # Extract station name (text after the code)
-                name_part = line.replace(code, '').strip()
+                # Extract station name (rest of the line holding the code)
+                line_start = page_text.rfind('\n', 0, match.start()) + 1
+                line_end = page_text.find('\n', match.end())
+                if line_end == -1:
+                    line_end = len(page_text)
+                name_part = page_text[line_start:line_end].replace(code, '').strip()
                 if name_part:
                     station_name = name_part
                 break
@@ -214,6 +289,8 @@ class DSIFinalExtractor:
         if not station_code:
             return None
         
+        lines = page_text.split('\n')
+        
         logger.info(f"[OK] Found station {station_code} on page {page_num}")
         
         # Extract all data
@@ -230,7 +307,7 @@ class DSIFinalExtractor:
                 annual_avg_flow = self._extract_annual_avg_flow(line, year)
         
         # Extract monthly data with structured parsing
-        monthly_data = self._extract_monthly_data_structured(page_text)
+        monthly_data = self._extract_monthly_data_structured(lines)
         
         # Extract annual totals
         annual_total, mm_total, avg_ltsnkm2 = self._extract_annual_totals(page_text)
@@ -276,13 +353,22 @@ class DSIFinalExtractor:
         
         return result
     
+    def _read_page_text(self, page) -> Optional[str]:
+        """Return page text, or None for pages without any target station prefix"""
+        # Skip pages without any target station prefix before extracting text
+        if not any(page.search_for(prefix) for prefix in self.station_prefixes):
+            return None
+        
+        # Extract text in reading order (top-left to bottom-right)
+        return page.get_text("text", sort=True, flags=TEXT_FLAGS)
+    
     def _process_pdf_structured(self, pdf_path: str) -> List[Dict]:
         """Process a single PDF file with structured approach"""
         results = []
         filename = os.path.basename(pdf_path)
         
         # Extract year from filename
-        year_match = re.search(r'(\d{4})', filename)
+        year_match = self.year_pattern.search(filename)
         if not year_match:
             logger.warning(f"Could not extract year from filename: {filename}")
             return results
@@ -297,10 +383,10 @@ class DSIFinalExtractor:
             pages_skipped = 0
             
             for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Extract text with proper encoding
-                page_text = page.get_text()
+                page_text = self._read_page_text(doc[page_num])
+                if page_text is None:
+                    pages_skipped += 1
+                    continue
                 
                 # Extract station data from this page
                 station_data = self._extract_station_data_structured(page_text, page_num + 1, filename, year)
@@ -320,25 +406,28 @@ class DSIFinalExtractor:
         return results
     
     def _append_to_csv(self, data: Dict):
-        """Append extracted data to CSV file"""
+        """Queue extracted data for the CSV file (written by flush)"""
+        # Prepare row data in the correct order
+        row = [
+            data['file'], data['page'], data['year'], data['station_code'],
+            data['station_name'], data['coordinates'], data['catchment_area_km2'],
+            data['annual_avg_flow_m3s'], data['annual_total_m3'], data['mm_total'],
+            data['avg_ltsnkm2']
+        ]
+        
+        # Add monthly data in metric-first order (as specified)
+        for metric in self.metrics:
+            for month in self.months:
+                key = f"{month}_{metric}_m3"
+                row.append(data.get(key))
+        
+        self._pending_rows.append(row)
+    
+    def flush(self):
+        """Write all queued rows to the CSV file with one open and writerows"""
         with open(self.output_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Prepare row data in the correct order
-            row = [
-                data['file'], data['page'], data['year'], data['station_code'],
-                data['station_name'], data['coordinates'], data['catchment_area_km2'],
-                data['annual_avg_flow_m3s'], data['annual_total_m3'], data['mm_total'],
-                data['avg_ltsnkm2']
-            ]
-            
-            # Add monthly data in metric-first order (as specified)
-            for metric in self.metrics:
-                for month in self.months:
-                    key = f"{month}_{metric}_m3"
-                    row.append(data.get(key))
-            
-            writer.writerow(row)
+            csv.writer(f).writerows(self._pending_rows)
+        self._pending_rows = []
     
     def process_all_pdfs_structured(self):
         """Process all PDF files with structured approach"""
@@ -351,33 +440,32 @@ class DSIFinalExtractor:
         
         logger.info(f"Found {len(pdf_files)} PDF files")
         
-        total_extracted = 0
-        processed_stations = set()
+        # Only files with a year in the name can be processed
+        pdf_paths = [os.path.join(self.pdf_directory, f) for f in pdf_files 
+                     if self.year_pattern.search(f)]
         
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(self.pdf_directory, pdf_file)
-            
-            # Extract year from filename
-            year_match = re.search(r'(\d{4})', pdf_file)
-            if not year_match:
-                continue
-            
-            year = int(year_match.group(1))
-            
-            # Process PDF
-            results = self._process_pdf_structured(pdf_path)
-            
-            for result in results:
-                # Check for duplicates
-                station_year_key = (result['station_code'], year)
-                if station_year_key in processed_stations:
-                    logger.warning(f"⚠️ {result['station_code']} skipped (duplicate)")
-                    continue
-                
-                # Append to CSV
-                self._append_to_csv(result)
-                processed_stations.add(station_year_key)
-                total_extracted += 1
+        # Process PDFs in parallel; map keeps the sorted file order
+        all_rows = []
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for results in executor.map(self._process_pdf_structured, pdf_paths):
+                all_rows.extend(results)
+        
+        # Keep the first row per (station, year); later duplicates are dropped
+        rows = {}
+        for result in all_rows:
+            rows.setdefault((result['station_code'], result['year']), result)
+        
+        duplicates = len(all_rows) - len(rows)
+        if duplicates:
+            logger.warning(f"⚠️ {duplicates} duplicate station rows skipped")
+        
+        # Queue for CSV
+        for result in rows.values():
+            self._append_to_csv(result)
+        total_extracted = len(rows)
+        
+        # Write all rows under the header in one go
+        self.flush()
         
         logger.info(f"[OK] CSV updated: {self.output_file}")
         logger.info(f"Total stations extracted: {total_extracted}")
@@ -5,6 +5,8 @@ Use the ORIGINAL working code for 2020 extraction
 
 import os
 import re
+import itertools
+import multiprocessing
 import csv
 import fitz  # PyMuPDF
 import pandas as pd
@@ -23,30 +25,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Regex patterns compiled once at import and reused for every page
+_STATION_RE = re.compile(r'\b([A-Z]\d{2}[A-Z]\d{3})\b')
+_COORD_RE = re.compile(r'\d+°\d+\'\d+"\s*(?:Doğu|Kuzey|DOĞU|KUZEY)', re.IGNORECASE)
+_NUMBER_RE = re.compile(r'\d+(?:[.,]\d+)?')  # digits with an optional decimal part
+_ANNUAL_TOTAL_RE = re.compile(r'SU\s*YILI.*?YILLIK\s*TOPLAM\s*AKIM.*?(\d+[.,]\d+)\s*MİLYON\s*M3', re.IGNORECASE)
+_MM_RE = re.compile(r'(\d+[.,]?\d*)\s*MM\.')
+_LTSNKM2_RE = re.compile(r'(\d+[.,]?\d*)\s*LT/SN/Km2')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# One alternation over the Turkish metric keywords; lastgroup gives the metric
+_METRIC_RE = re.compile(
+    r'(?P<flow_max>Maks\.|MAKS\.)|(?P<flow_min>Min\.|MIN\.)|(?P<flow_avg>Ortalama|ORTALAMA)'
+    r'|(?P<ltsnkm2>LT/SN/Km2|LT/SN/KM2)|(?P<akim_mm>AKIM mm\.|AKIM MM\.)|(?P<milm3>MİL\. M3|MIL\. M3)'
+)
+
+# Whole lines containing a metric keyword, matched straight from the page text
+_METRIC_LINE_RE = re.compile(r'(?m)^[^\n]*?(?:' + _METRIC_RE.pattern + r')[^\n]*$')
+
+# Plain text extraction without ligature glyphs (keeps "fi"/"fl" as separate letters)
+TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+# Turkish decimal comma -> dot
+_COMMA_TRANS = str.maketrans({',': '.'})
+
+# Annual average flow patterns depend on the year; compiled once per year
+_ANNUAL_RE_CACHE: Dict[int, re.Pattern] = {}
+
+# Fixed extraction targets, shared by every extractor instance
+_TARGET_STATIONS = frozenset({
+    'D14A011', 'D14A117', 'D14A144', 'D14A146', 'D14A149', 'D14A162',
+    'D14A172', 'D14A192', 'D14A018', 'D22A093', 'D22A095', 'D22A105',
+    'D22A106', 'D22A158', 'E22A054', 'D22A116', 'E22A065'
+})
+
+# One fused alternation over the target codes; only these are ever scanned for
+_TARGET_STATION_RE = re.compile(r'\b(' + '|'.join(map(re.escape, sorted(_TARGET_STATIONS))) + r')\b')
+
+# English month order (water year: Oct to Sep)
+_MONTHS = ("oct", "nov", "dec", "jan", "feb", "mar",
+           "apr", "may", "jun", "jul", "aug", "sep")
+
+# Metrics in exact order as specified
+_METRICS = ('flow_max', 'flow_min', 'flow_avg', 'ltsnkm2', 'akim_mm', 'milm3')
+
+# Turkish metric keywords
+_METRIC_KEYWORDS = {
+    'flow_max': ('Maks.', 'MAKS.'),
+    'flow_min': ('Min.', 'MIN.'),
+    'flow_avg': ('Ortalama', 'ORTALAMA'),
+    'ltsnkm2': ('LT/SN/Km2', 'LT/SN/KM2'),
+    'akim_mm': ('AKIM mm.', 'AKIM MM.'),
+    'milm3': ('MİL. M3', 'MIL. M3')
+}
+
 class DSIExtractor2020:
     def __init__(self):
-        self.target_stations = {
-            'D14A011', 'D14A117', 'D14A144', 'D14A146', 'D14A149', 'D14A162',
-            'D14A172', 'D14A192', 'D14A018', 'D22A093', 'D22A095', 'D22A105',
-            'D22A106', 'D22A158', 'E22A054', 'D22A116', 'E22A065'
-        }
-        
-        # English month order (water year: Oct to Sep)
-        self.months = ["oct", "nov", "dec", "jan", "feb", "mar", 
-                      "apr", "may", "jun", "jul", "aug", "sep"]
-        
-        # Metrics in exact order as specified
-        self.metrics = ['flow_max', 'flow_min', 'flow_avg', 'ltsnkm2', 'akim_mm', 'milm3']
-        
-        # Turkish metric keywords
-        self.metric_keywords = {
-            'flow_max': ['Maks.', 'MAKS.'],
-            'flow_min': ['Min.', 'MIN.'],
-            'flow_avg': ['Ortalama', 'ORTALAMA'],
-            'ltsnkm2': ['LT/SN/Km2', 'LT/SN/KM2'],
-            'akim_mm': ['AKIM mm.', 'AKIM MM.'],
-            'milm3': ['MİL. M3', 'MIL. M3']
-        }
+        # Immutable module constants; nothing is rebuilt per instance
+        self.target_stations = _TARGET_STATIONS
+        self.months = _MONTHS
+        self.metrics = _METRICS
+        self.metric_keywords = _METRIC_KEYWORDS
     
     def _normalize_number(self, text: str) -> Optional[float]:
         """Normalize number from text"""
@@ -54,25 +93,26 @@ class DSIExtractor2020:
             return None
         try:
             # Replace comma with dot for decimal separator
-            normalized = text.replace(',', '.')
-            return float(normalized)
-        except (ValueError, TypeError):
+            return float(text.translate(_COMMA_TRANS))
+        except ValueError:
             return None
     
     def _extract_station_code(self, text: str) -> Optional[str]:
         """Extract station code from text"""
-        pattern = r'\b([A-Z]\d{2}[A-Z]\d{3})\b'
-        matches = re.findall(pattern, text)
-        if matches:
-            return matches[0]
-        return None
+        # DSI station codes start with D or E; skip the regex on lines without either
+        if 'D' not in text and 'E' not in text:
+            return None
+        match = _STATION_RE.search(text)
+        return match.group(1) if match else None
     
     def _extract_coordinates(self, text: str) -> Optional[str]:
         """Extract coordinates from text"""
-        pattern = r'\d+°\d+\'\d+"\s*(?:Doğu|Kuzey|DOĞU|KUZEY)'
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        if len(matches) >= 2:
-            return ' '.join(matches[:2])
+        # Only the first two matches are needed; stop scanning after them
+        matches = _COORD_RE.finditer(text)
+        first = next(matches, None)
+        second = next(matches, None)
+        if second is not None:
+            return f"{first.group()} {second.group()}"
         return None
     
     def _extract_catchment_area(self, text: str) -> Optional[float]:
@@ -83,50 +123,57 @@ class DSIExtractor2020:
     
     def _extract_annual_avg_flow(self, text: str, year: int) -> Optional[float]:
         """Extract annual average flow for specific year"""
-        year_pattern = rf'{year}\s*Su\s*yılında.*?(\d+[.,]\d+)\s*m3/sn'
-        matches = re.findall(year_pattern, text, re.IGNORECASE)
-        if matches:
-            return self._normalize_number(matches[0])
+        year_re = _ANNUAL_RE_CACHE.get(year)
+        if year_re is None:
+            year_re = re.compile(rf'{year}\s*Su\s*yılında.*?(\d+[.,]\d+)\s*m3/sn', re.IGNORECASE)
+            _ANNUAL_RE_CACHE[year] = year_re
+        match = year_re.search(text)
+        if match:
+            return self._normalize_number(match.group(1))
         return None
     
-    def _extract_monthly_data_structured(self, text: str) -> Dict[str, Dict[str, float]]:
+    def _extract_monthly_data_structured(self, text: str) -> Dict[str, Optional[float]]:
         """Extract monthly data with structured parsing - SAME AS ORIGINAL"""
-        monthly_data = {}
+        # One flat slot per "{month}_{metric}", missing values stay None
+        monthly_data = dict.fromkeys(f"{month}_{metric}" for month in self.months for metric in self.metrics)
         
-        # Split text into lines
-        lines = text.split('\n')
+        # Bind lookups used on every line to locals
+        iter_metric_lines = _METRIC_LINE_RE.finditer
+        iter_numbers = _NUMBER_RE.finditer
+        normalize = self._normalize_number
+        months = self.months
+        n_months = len(months)
+        log_info = logger.info if logger.isEnabledFor(logging.INFO) else None
+        log_debug = logger.debug if logger.isEnabledFor(logging.DEBUG) else None
         
         # Find lines with metric keywords
-        for line in lines:
-            # Check if this line contains a metric keyword
-            current_metric = None
-            for metric, keywords in self.metric_keywords.items():
-                if any(keyword in line for keyword in keywords):
-                    current_metric = metric
-                    break
+        for metric_match in iter_metric_lines(text):
+            line = metric_match.group(0)
+            current_metric = metric_match.lastgroup
             
-            if not current_metric:
-                continue
-            
-            logger.info(f"Processing {current_metric} line: {line[:100]}...")
+            if log_info:
+                log_info(f"Processing {current_metric} line: {line[:100]}...")
             
-            # Extract numbers from this line - should have exactly 12 values
-            numbers = re.findall(r'[\d.,]+', line)
+            # Extract numbers after the keyword - should have exactly 12 values
+            # (skips digits inside keywords like "Km2"/"M3"; stop once all 12 months are filled)
+            numbers = []
+            append_number = numbers.append
+            for number_match in iter_numbers(line, metric_match.end(current_metric) - metric_match.start()):
+                append_number(number_match.group())
+                if len(numbers) == n_months:
+                    break
             
             if len(numbers) >= 12:  # Should have 12 monthly values
-                logger.info(f"Found {len(numbers)} values for {current_metric}")
+                if log_info:
+                    log_info(f"Found {len(numbers)} values for {current_metric}")
                 
                 # Map values to months (Oct-Sep order)
-                for j, month in enumerate(self.months):
-                    if j < len(numbers):
-                        value = self._normalize_number(numbers[j])
-                        
-                        if month not in monthly_data:
-                            monthly_data[month] = {}
-                        monthly_data[month][current_metric] = value
-                        
-                        if value is not None:
-                            logger.debug(f"  {month}: {value}")
+                for month, number in zip(months, numbers):
+                    value = normalize(number)
+                    monthly_data[f"{month}_{current_metric}"] = value
+                    
+                    if log_debug and value is not None:
+                        log_debug(f"  {month}: {value}")
             else:
                 logger.warning(f"Only found {len(numbers)} values for {current_metric}, expected 12")
         
@@ -139,105 +186,126 @@ class DSIExtractor2020:
         avg_ltsnkm2 = None
         
         # Extract annual total
-        annual_pattern = r'SU\s*YILI.*?YILLIK\s*TOPLAM\s*AKIM.*?(\d+[.,]\d+)\s*MİLYON\s*M3'
-        matches = re.findall(annual_pattern, text, re.IGNORECASE)
-        if matches:
-            annual_total = self._normalize_number(matches[0])
+        match = _ANNUAL_TOTAL_RE.search(text)
+        if match:
+            annual_total = self._normalize_number(match.group(1))
         
-        # Extract mm total and avg ltsnkm2
-        mm_pattern = r'(\d+[.,]?\d*)\s*MM\.'
-        ltsnkm2_pattern = r'(\d+[.,]?\d*)\s*LT/SN/Km2'
+        # Extract mm total and avg ltsnkm2 (take last occurrence, without building match lists)
+        mm_match = None
+        for mm_match in _MM_RE.finditer(text):
+            pass
+        ltsnkm2_match = None
+        for ltsnkm2_match in _LTSNKM2_RE.finditer(text):
+            pass
         
-        mm_matches = re.findall(mm_pattern, text)
-        ltsnkm2_matches = re.findall(ltsnkm2_pattern, text)
-        
-        if mm_matches:
-            mm_total = self._normalize_number(mm_matches[-1])  # Take last occurrence
-        if ltsnkm2_matches:
-            avg_ltsnkm2 = self._normalize_number(ltsnkm2_matches[-1])  # Take last occurrence
+        if mm_match:
+            mm_total = self._normalize_number(mm_match.group(1))
+        if ltsnkm2_match:
+            avg_ltsnkm2 = self._normalize_number(ltsnkm2_match.group(1))
         
         return annual_total, mm_total, avg_ltsnkm2
     
     def _extract_station_data_structured(self, page_text: str, page_num: int, filename: str, year: int) -> Optional[Dict]:
         """Extract all station data with structured approach - SAME AS ORIGINAL"""
-        lines = page_text.split('\n')
-        
-        # Look for station code in every 2nd row (as specified)
-        for i in range(0, len(lines), 2):
-            line = lines[i]
-            station_code = self._extract_station_code(line)
+        # Look for station code in every 2nd row (as specified): walk the target
+        # codes only, keeping those that are the first code on an even line
+        line_no = 0
+        last_pos = 0
+        for station_match in _TARGET_STATION_RE.finditer(page_text):
+            line_start = page_text.rfind('\n', 0, station_match.start()) + 1
+            line_no += page_text.count('\n', last_pos, line_start)
+            last_pos = line_start
+            if line_no % 2:
+                continue
             
-            if station_code and station_code in self.target_stations:
-                logger.info(f"Found station {station_code} on page {page_num}")
-                
-                # Extract station name (text after station code)
-                station_name = line.replace(station_code, '').strip()
-                station_name = re.sub(r'\s+', ' ', station_name)
-                
-                # Extract other data from the page
-                coordinates = self._extract_coordinates(page_text)
-                catchment_area = self._extract_catchment_area(page_text)
-                annual_avg_flow = self._extract_annual_avg_flow(page_text, year)
-                annual_total, mm_total, avg_ltsnkm2 = self._extract_annual_totals(page_text)
-                
-                # Extract monthly data
-                monthly_data = self._extract_monthly_data_structured(page_text)
-                
-                # Create result dictionary
-                result = {
-                    'file': filename,
-                    'page': page_num,
-                    'year': year,
-                    'station_code': station_code,
-                    'station_name': station_name,
-                    'coordinates': coordinates,
-                    'catchment_area_km2': catchment_area,
-                    'annual_avg_flow_m3s': annual_avg_flow,
-                    'annual_total_m3': annual_total,
-                    'mm_total': mm_total,
-                    'avg_ltsnkm2': avg_ltsnkm2
-                }
-                
-                # Add monthly data
-                for month in self.months:
-                    for metric in self.metrics:
-                        key = f"{month}_{metric}_m3"
-                        if month in monthly_data and metric in monthly_data[month]:
-                            result[key] = monthly_data[month][metric]
-                        else:
-                            result[key] = None
-                
-                return result
+            line_end = page_text.find('\n', station_match.end())
+            if line_end == -1:
+                line_end = len(page_text)
+            if _STATION_RE.search(page_text, line_start, line_end).start() != station_match.start():
+                continue
+            
+            line = page_text[line_start:line_end]
+            station_code = station_match.group(1)
+            
+            logger.info(f"Found station {station_code} on page {page_num}")
+            
+            # Extract station name (text after station code)
+            station_name = line.replace(station_code, '').strip()
+            station_name = _WHITESPACE_RE.sub(' ', station_name)
+            
+            # Extract other data from the page
+            coordinates = self._extract_coordinates(page_text)
+            catchment_area = self._extract_catchment_area(page_text)
+            annual_avg_flow = self._extract_annual_avg_flow(page_text, year)
+            annual_total, mm_total, avg_ltsnkm2 = self._extract_annual_totals(page_text)
+            
+            # Extract monthly data
+            monthly_data = self._extract_monthly_data_structured(page_text)
+            
+            # Create result dictionary
+            result = {
+                'file': filename,
+                'page': page_num,
+                'year': year,
+                'station_code': station_code,
+                'station_name': station_name,
+                'coordinates': coordinates,
+                'catchment_area_km2': catchment_area,
+                'annual_avg_flow_m3s': annual_avg_flow,
+                'annual_total_m3': annual_total,
+                'mm_total': mm_total,
+                'avg_ltsnkm2': avg_ltsnkm2
+            }
+            
+            # Add monthly data
+            for key, value in monthly_data.items():
+                result[f"{key}_m3"] = value
+            
+            return result
         
         return None
     
     def extract_2020_data(self):
-        """Extract 2020 data using the ORIGINAL working method"""
+        """Yield 2020 station records page by page using the ORIGINAL working method"""
         pdf_path = r"C:\Users\Asus\Desktop\bitirme_projesi\debi_raporlari\akim_gözlem_yilligi\dsi_2020.pdf"
         
         if not os.path.exists(pdf_path):
             logger.error(f"PDF not found: {pdf_path}")
-            return []
+            return
         
-        results = []
-        doc = fitz.open(pdf_path)
+        with fitz.open(pdf_path) as doc:
+            page_count = len(doc)
         
         logger.info(f"Processing dsi_2020.pdf with ORIGINAL method...")
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            page_text = page.get_text()
-            
-            # Extract station data from this page
-            station_data = self._extract_station_data_structured(page_text, page_num + 1, 'dsi_2020.pdf', 2020)
-            if station_data:
-                results.append(station_data)
-                logger.info(f"[OK] Extracted: {station_data['station_code']} - {station_data['station_name']}")
-                if station_data['annual_avg_flow_m3s']:
-                    logger.info(f"  Annual flow: {station_data['annual_avg_flow_m3s']} m³/s")
-        
-        doc.close()
-        return results
+        # Pages are independent: spread them over up to 4 worker processes,
+        # each with its own open document (imap keeps page order)
+        args_list = [(page_num, 'dsi_2020.pdf', 2020) for page_num in range(page_count)]
+        n_workers = min(os.cpu_count() or 1, 4)
+        with multiprocessing.Pool(n_workers, initializer=_init_page_worker, 
+                                  initargs=(pdf_path, self)) as pool:
+            for station_data in pool.imap(_process_page, args_list, chunksize=8):
+                if station_data:
+                    logger.info(f"[OK] Extracted: {station_data['station_code']} - {station_data['station_name']}")
+                    if station_data['annual_avg_flow_m3s']:
+                        logger.info(f"  Annual flow: {station_data['annual_avg_flow_m3s']} m³/s")
+                    yield station_data
+
+# Per-process state for the page pool (fitz documents cannot be shared between processes)
+_worker_doc = None
+_worker_extractor = None
+
+def _init_page_worker(pdf_path, extractor):
+    """Open the PDF once per worker process"""
+    global _worker_doc, _worker_extractor
+    _worker_doc = fitz.open(pdf_path)
+    _worker_extractor = extractor
+
+def _process_page(args):
+    """Extract station data from one page in a worker process"""
+    page_num, filename, year = args
+    page_text = _worker_doc[page_num].get_text("text", sort=True, flags=TEXT_FLAGS)
+    return _worker_extractor._extract_station_data_structured(page_text, page_num + 1, filename, year)
 
 def update_csv_with_original_method():
     """Update CSV using the ORIGINAL working method"""
@@ -250,42 +318,51 @@ def update_csv_with_original_method():
     existing_df = existing_df[existing_df['year'] != 2020]
     print(f"Removed 2020 data. Remaining records: {len(existing_df)}")
     
-    # Extract 2020 data using ORIGINAL method
+    # Extract 2020 data using ORIGINAL method; records are streamed, not collected
     extractor = DSIExtractor2020()
     extracted_data = extractor.extract_2020_data()
     
-    if not extracted_data:
+    # Leave the CSV untouched when nothing is extracted
+    first_record = next(extracted_data, None)
+    if first_record is None:
         print("No 2020 data extracted")
         return
     
-    # Create DataFrame from extracted data
-    new_df = pd.DataFrame(extracted_data)
-    
-    # Ensure all columns exist
-    for col in existing_df.columns:
-        if col not in new_df.columns:
-            new_df[col] = None
-    
-    # Reorder columns to match existing structure
-    new_df = new_df[existing_df.columns]
-    
-    # Combine dataframes
-    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+    # Stream into a temporary file next to the CSV; the original is only
+    # replaced once extraction has finished without errors
+    tmp_path = csv_path + '.tmp'
+    existing_df.to_csv(tmp_path, index=False)
+    n_existing = len(existing_df)
+    fieldnames = list(existing_df.columns)
+    del existing_df
     
-    # Save updated CSV
-    combined_df.to_csv(csv_path, index=False)
+    n_new = 0
+    stations_with_flow = []
+    try:
+        with open(tmp_path, 'a', newline='', encoding='utf-8') as f:
+            # Match pandas' to_csv output: missing/extra columns handled like reindex
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore',
+                                    lineterminator=os.linesep)
+            for data in itertools.chain((first_record,), extracted_data):
+                writer.writerow(data)
+                n_new += 1
+                if data['annual_avg_flow_m3s'] is not None:
+                    stations_with_flow.append((data['station_code'], data['annual_avg_flow_m3s']))
+        os.replace(tmp_path, csv_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
     
-    print(f"\nUpdated CSV with {len(extracted_data)} ORIGINAL METHOD 2020 records")
-    print(f"Total records: {len(combined_df)}")
+    print(f"\nUpdated CSV with {n_new} ORIGINAL METHOD 2020 records")
+    print(f"Total records: {n_existing + n_new}")
     
     # Show summary
-    stations_with_flow = [d for d in extracted_data if d['annual_avg_flow_m3s'] is not None]
     print(f"Stations with flow data: {len(stations_with_flow)}")
     
     if stations_with_flow:
         print("\nStations with annual flow data:")
-        for data in stations_with_flow:
-            print(f"  {data['station_code']}: {data['annual_avg_flow_m3s']} m³/s")
+        for station_code, annual_avg_flow in stations_with_flow:
+            print(f"  {station_code}: {annual_avg_flow} m³/s")
 
 def main():
     update_csv_with_original_method()
@@ -11,8 +11,13 @@ Date: 2024
 
 import os
 import re
+import io
 import csv
+import mmap
 import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from numba import njit
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
@@ -21,6 +26,23 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@contextmanager
+def open_pdf_mapped(pdf_path):
+    """Open a PDF from a read-only memory map of the file (reads served by the OS page cache)."""
+    with open(pdf_path, 'rb') as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view, \
+            fitz.open(stream=view, filetype='pdf') as doc:
+        yield doc
+
+@njit(cache=True)
+def _dms_to_decimal(degrees, minutes, seconds, negative):
+    """Degrees/minutes/seconds to signed decimal degrees"""
+    return (-1.0 if negative else 1.0) * (degrees + minutes/60 + seconds/3600)
+
+# Height (points) of the top band holding the page header lines
+HEADER_CLIP_HEIGHT = 80
+
 class DSIExtractor:
     """Fast and memory-efficient DSİ PDF data extractor."""
     
@@ -44,19 +66,50 @@ class DSIExtractor:
         # Regex patterns for data extraction
         self.station_code_pattern = re.compile(r'[A-Z]\d{2}[A-Z]\d{3}')
         
-        # Coordinate patterns (Turkish and English notation)
-        self.coord_patterns = [
+        # One alternation over the target codes: finds and filters in a single pass
+        self.target_code_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, sorted(self.target_stations, key=len, reverse=True))) + r')\b'
+        )
+        
+        # Byte patterns for the raw content-stream prefilter (see _skip_by_raw_content)
+        self._target_bytes = [code.encode('ascii') for code in sorted(self.target_stations)]
+        self._raw_code_pattern = re.compile(rb'[A-Z]\d{2}[A-Z]\d{3}')
+        
+        # Coordinate patterns (Turkish and English notation) in one alternation;
+        # the group prefix tells which notation matched
+        self.coord_pattern = re.compile(
             # Turkish notation from screenshots: "26°34'20" Doğu - 41°38'50" Kuzey"
-            re.compile(r'(\d{1,2})°(\d{1,2})\'(\d{1,2})"\s*(Doğu|Batı)\s*-\s*(\d{1,2})°(\d{1,2})\'(\d{1,2})"\s*(Kuzey|Güney)'),
+            r'(?P<t_lon_deg>\d{1,2})°(?P<t_lon_min>\d{1,2})\'(?P<t_lon_sec>\d{1,2})"\s*(?P<t_lon_dir>Doğu|Batı)\s*-\s*'
+            r'(?P<t_lat_deg>\d{1,2})°(?P<t_lat_min>\d{1,2})\'(?P<t_lat_sec>\d{1,2})"\s*(?P<t_lat_dir>Kuzey|Güney)'
             # Turkish notation: 40°12'30"K 36°52'10"D
-            re.compile(r'(\d{1,2})°(\d{1,2})\'(\d{1,2})"([KD])\s+(\d{1,2})°(\d{1,2})\'(\d{1,2})"([KD])'),
+            r'|(?P<k_lat_deg>\d{1,2})°(?P<k_lat_min>\d{1,2})\'(?P<k_lat_sec>\d{1,2})"(?P<k_lat_dir>[KD])\s+'
+            r'(?P<k_lon_deg>\d{1,2})°(?P<k_lon_min>\d{1,2})\'(?P<k_lon_sec>\d{1,2})"(?P<k_lon_dir>[KD])'
             # English notation: 40°12'30"N 36°52'10"E
-            re.compile(r'(\d{1,2})°(\d{1,2})\'(\d{1,2})"([NS])\s+(\d{1,2})°(\d{1,2})\'(\d{1,2})"([EW])')
-        ]
+            r'|(?P<e_lat_deg>\d{1,2})°(?P<e_lat_min>\d{1,2})\'(?P<e_lat_sec>\d{1,2})"(?P<e_lat_dir>[NS])\s+'
+            r'(?P<e_lon_deg>\d{1,2})°(?P<e_lon_min>\d{1,2})\'(?P<e_lon_sec>\d{1,2})"(?P<e_lon_dir>[EW])'
+        )
         
         # Numeric patterns for discharge data (improved for comma/dot handling)
         self.numeric_pattern = re.compile(r'(\d+[.,]\d+|\d+)')
-        self.numeric_with_unit_pattern = re.compile(r'(\d+[.,]\d+|\d+)\s*(m3/sn|m³/sn|milyon|m3|lt/sn|mm)', re.IGNORECASE)
+        # Matched against case-folded page text (see fold_case), so no IGNORECASE needed
+        self.numeric_with_unit_pattern = re.compile(r'(\d+[.,]\d+|\d+)\s*(m3/sn|m³/sn|milyon|m3|lt/sn|mm)')
+        
+        # Case-folded keyword patterns (in priority order) for discharge data;
+        # the annual mean list depends on the year and is built once per year
+        self._annual_mean_patterns = {}
+        self._total_flow_patterns = self._keyword_patterns([
+            'yıllık toplam', 'total annual', 'toplam',
+            'yıllık toplam akım', 'milyon m3', 'milyon',
+            'yıllık toplam akım', 'toplam akım'
+        ])
+        self._specific_flow_patterns = self._keyword_patterns([
+            'özgül debi', 'specific flow', 'özgül',
+            'lt/sn/km2', 'lt/sn/km', 'lt/sn',
+            'özgül akım'
+        ])
+        
+        # Single buffered CSV handle shared by all PDFs (opened in run())
+        self._csv_fh = None
         
         # Initialize CSV file with headers if it doesn't exist
         self._initialize_csv()
@@ -73,6 +126,53 @@ class DSIExtractor:
                 writer.writerow(headers)
             logger.info(f"Created new CSV file: {self.output_csv}")
     
+    def __getstate__(self):
+        """Pickle without the open CSV handle (worker processes never write)."""
+        state = self.__dict__.copy()
+        state['_csv_fh'] = None
+        return state
+    
+    def _open_writer(self):
+        """Open the output CSV once for appending, with a large write buffer."""
+        if self._csv_fh is None:
+            self._csv_fh = open(self.output_csv, 'a', newline='', encoding='utf-8', buffering=1 << 20)
+    
+    def _close_writer(self):
+        """Flush and close the shared CSV handle."""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+    
+    @staticmethod
+    def _format_rows(rows: List[List]) -> str:
+        """Serialize rows to CSV text in memory (C csv writer, same quoting as the file)."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+    
+    def _write_csv_text(self, text: str):
+        """Append pre-formatted CSV text in one write and flush it to disk."""
+        if not text:
+            return
+        self._open_writer()
+        self._csv_fh.write(text)
+        self._csv_fh.flush()
+    
+    def _write_rows(self, rows: List[List]):
+        """Append a batch of rows in one write and flush them to disk."""
+        if rows:
+            self._write_csv_text(self._format_rows(rows))
+    
+    @staticmethod
+    def fold_case(text: str) -> str:
+        """Case-fold text once for case-sensitive matching (Turkish ı/İ fold to plain i)."""
+        return text.casefold().replace('ı', 'i').replace('\u0307', '')
+    
+    @classmethod
+    def _keyword_patterns(cls, keywords: List[str]) -> List[re.Pattern]:
+        """Compile case-folded keywords into literal patterns, keeping their order."""
+        return [re.compile(re.escape(cls.fold_case(keyword))) for keyword in keywords]
+    
     def extract_year_from_filename(self, filename: str) -> Optional[int]:
         """
         Extract year from PDF filename.
@@ -86,27 +186,71 @@ class DSIExtractor:
         year_match = re.search(r'(\d{4})', filename)
         return int(year_match.group(1)) if year_match else None
     
+    def _skip_by_raw_content(self, page) -> bool:
+        """
+        Decide from the page's raw content stream whether it can be skipped.
+        
+        Only pages whose stream shows station codes as plain ASCII, none of them
+        a target, are skipped; hex/CID encoded or compressed-font text cannot be
+        read this way, so such pages always go through normal text extraction.
+        
+        Args:
+            page: PyMuPDF page object
+            
+        Returns:
+            True if the page holds no target station code
+        """
+        try:
+            raw = page.read_contents()
+        except Exception:
+            return False
+        if not raw or not self._raw_code_pattern.search(raw):
+            return False
+        return not any(code in raw for code in self._target_bytes)
+    
     def get_second_line_text(self, page) -> str:
         """
         Extract only the second line of text from a PDF page.
         
+        Only the header band is extracted; the full page is read only when
+        the band holds fewer than two lines.
+        
         Args:
             page: PyMuPDF page object
             
         Returns:
             Second line text or empty string
         """
+        return self._read_second_line(page)[0]
+    
+    def _read_second_line(self, page) -> Tuple[str, Optional[str]]:
+        """
+        Extract the second line of text, plus the full page text if it had to be read.
+        
+        Args:
+            page: PyMuPDF page object
+            
+        Returns:
+            Tuple of (second line or empty string, full page text or None)
+        """
         try:
+            # MuPDF skips all text outside the clip rectangle
+            rect = page.rect
+            header_rect = fitz.Rect(rect.x0, rect.y0, rect.x1, rect.y0 + HEADER_CLIP_HEIGHT)
+            lines = page.get_text("text", clip=header_rect).split('\n', 2)
+            if len(lines) > 2:
+                return lines[1].strip(), None
+            
             text = page.get_text()
             lines = text.split('\n')
-            return lines[1].strip() if len(lines) > 1 else ""
+            return (lines[1].strip() if len(lines) > 1 else ""), text
         except Exception as e:
             logger.warning(f"Error reading page text: {e}")
-            return ""
+            return "", None
     
     def parse_coordinates(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Parse coordinates from text using multiple patterns.
+        Parse coordinates from text with one pass of the combined coordinate pattern.
         
         Args:
             text: Text containing coordinates
@@ -114,89 +258,50 @@ class DSIExtractor:
         Returns:
             Tuple of (latitude, longitude) or (None, None)
         """
-        for pattern in self.coord_patterns:
-            match = pattern.search(text)
-            if match:
-                groups = match.groups()
-                
-                if len(groups) == 8:
-                    # Turkish notation from screenshots: "26°34'20" Doğu - 41°38'50" Kuzey"
-                    if groups[3] in ['Doğu', 'Batı'] and groups[7] in ['Kuzey', 'Güney']:
-                        lon_deg, lon_min, lon_sec, lon_dir = groups[:4]
-                        lat_deg, lat_min, lat_sec, lat_dir = groups[4:]
-                        
-                        # Convert to decimal degrees
-                        lat_decimal = float(lat_deg) + float(lat_min)/60 + float(lat_sec)/3600
-                        lon_decimal = float(lon_deg) + float(lon_min)/60 + float(lon_sec)/3600
-                        
-                        # Apply direction
-                        if lat_dir == 'Güney':  # South
-                            lat_decimal = -lat_decimal
-                        if lon_dir == 'Batı':   # West
-                            lon_decimal = -lon_decimal
-                            
-                        return f"{lat_decimal:.6f}", f"{lon_decimal:.6f}"
-                    
-                    # Turkish notation: K/D
-                    elif groups[3] in 'KD' and groups[7] in 'KD':
-                        lat_deg, lat_min, lat_sec, lat_dir = groups[:4]
-                        lon_deg, lon_min, lon_sec, lon_dir = groups[4:]
-                        
-                        # Convert to decimal degrees
-                        lat_decimal = float(lat_deg) + float(lat_min)/60 + float(lat_sec)/3600
-                        lon_decimal = float(lon_deg) + float(lon_min)/60 + float(lon_sec)/3600
-                        
-                        # Apply direction
-                        if lat_dir == 'K':  # Kuzey (North)
-                            lat_decimal = lat_decimal
-                        else:  # Güney (South)
-                            lat_decimal = -lat_decimal
-                            
-                        if lon_dir == 'D':  # Doğu (East)
-                            lon_decimal = lon_decimal
-                        else:  # Batı (West)
-                            lon_decimal = -lon_decimal
-                            
-                        return f"{lat_decimal:.6f}", f"{lon_decimal:.6f}"
-                    
-                    # English notation: N/S/E/W
-                    elif groups[3] in 'NS' and groups[7] in 'EW':
-                        lat_deg, lat_min, lat_sec, lat_dir = groups[:4]
-                        lon_deg, lon_min, lon_sec, lon_dir = groups[4:]
-                        
-                        # Convert to decimal degrees
-                        lat_decimal = float(lat_deg) + float(lat_min)/60 + float(lat_sec)/3600
-                        lon_decimal = float(lon_deg) + float(lon_min)/60 + float(lon_sec)/3600
-                        
-                        # Apply direction
-                        if lat_dir == 'S':
-                            lat_decimal = -lat_decimal
-                        if lon_dir == 'W':
-                            lon_decimal = -lon_decimal
-                            
-                        return f"{lat_decimal:.6f}", f"{lon_decimal:.6f}"
-        
-        return None, None
+        match = self.coord_pattern.search(text)
+        if not match:
+            return None, None
+        
+        # Prefix of the alternative that matched: t (Doğu/Kuzey), k (K/D) or e (N/S/E/W)
+        prefix = next(name[0] for name in ('t_lat_deg', 'k_lat_deg', 'e_lat_deg') if match.group(name))
+        lat_deg, lat_min, lat_sec, lat_dir = match.group(f'{prefix}_lat_deg', f'{prefix}_lat_min',
+                                                         f'{prefix}_lat_sec', f'{prefix}_lat_dir')
+        lon_deg, lon_min, lon_sec, lon_dir = match.group(f'{prefix}_lon_deg', f'{prefix}_lon_min',
+                                                         f'{prefix}_lon_sec', f'{prefix}_lon_dir')
+        
+        # Direction
+        if prefix == 'k':
+            # Turkish notation: K = Kuzey (North), D = Doğu (East)
+            south = lat_dir != 'K'
+            west = lon_dir != 'D'
+        else:
+            south = lat_dir in ('Güney', 'S')
+            west = lon_dir in ('Batı', 'W')
+        
+        # Convert to signed decimal degrees (numeric part compiled; strings stay in Python)
+        lat_decimal = _dms_to_decimal(float(lat_deg), float(lat_min), float(lat_sec), south)
+        lon_decimal = _dms_to_decimal(float(lon_deg), float(lon_min), float(lon_sec), west)
+        
+        return f"{lat_decimal:.6f}", f"{lon_decimal:.6f}"
     
-    def extract_numeric_value(self, text: str, keywords: List[str]) -> Optional[str]:
+    def extract_numeric_value(self, text: str, keyword_patterns: List[re.Pattern]) -> Optional[str]:
         """
         Extract numeric value following specific keywords.
         
         Args:
-            text: Text to search in
-            keywords: List of keywords to look for
+            text: Case-folded text to search in (see fold_case)
+            keyword_patterns: Compiled keyword patterns to look for, in priority order
             
         Returns:
             Numeric value as string or None
         """
-        text_lower = text.lower()
-        
-        for keyword in keywords:
+        for keyword_pattern in keyword_patterns:
             # Find keyword position
-            keyword_pos = text_lower.find(keyword.lower())
-            if keyword_pos != -1:
+            keyword_match = keyword_pattern.search(text)
+            if keyword_match:
                 # Look for numeric value with unit after keyword
-                after_keyword = text[keyword_pos + len(keyword):keyword_pos + len(keyword) + 100]
+                keyword_end = keyword_match.end()
+                after_keyword = text[keyword_end:keyword_end + 100]
                 
                 # First try to match numeric value with unit
                 match = self.numeric_with_unit_pattern.search(after_keyword)
@@ -210,7 +315,7 @@ class DSIExtractor:
         
         return None
     
-    def extract_station_data(self, page, station_code: str, year: int) -> Optional[Dict]:
+    def extract_station_data(self, page, station_code: str, year: int, full_text: Optional[str] = None) -> Optional[Dict]:
         """
         Extract all required data for a station from a page.
         
@@ -218,50 +323,56 @@ class DSIExtractor:
             page: PyMuPDF page object
             station_code: Detected station code
             year: Year from filename
+            full_text: Page text if already extracted (read from the page otherwise)
             
         Returns:
             Dictionary with extracted data or None if extraction fails
         """
         try:
-            full_text = page.get_text()
+            if full_text is None:
+                full_text = page.get_text()
             
             # Extract station name (usually follows the station code on same line)
-            lines = full_text.split('\n')
             station_name = ""
             
-            # Look for station name in first few lines
-            for line in lines[:5]:
-                if station_code in line:
-                    # Extract everything after the station code
-                    parts = line.split(station_code)
-                    if len(parts) > 1:
-                        station_name = parts[1].strip()
-                        break
+            # Look for station name in first few lines; find() on the page text
+            # instead of splitting the whole page into lines
+            header_end = -1
+            for _ in range(5):
+                header_end = full_text.find('\n', header_end + 1)
+                if header_end == -1:
+                    header_end = len(full_text)
+                    break
+            
+            code_pos = full_text.find(station_code, 0, header_end)
+            if code_pos != -1:
+                # Extract everything after the station code (up to line end or a repeat of the code)
+                name_start = code_pos + len(station_code)
+                name_end = full_text.find('\n', name_start)
+                if name_end == -1:
+                    name_end = len(full_text)
+                repeat_pos = full_text.find(station_code, name_start, name_end)
+                if repeat_pos != -1:
+                    name_end = repeat_pos
+                station_name = full_text[name_start:name_end].strip()
             
             # Parse coordinates
             latitude, longitude = self.parse_coordinates(full_text)
             
             # Extract discharge data with improved Turkish keywords
-            annual_mean_keywords = [
-                f'{year} su yılında', 'su yılında', 'yıllık ortalama', 
-                'annual mean', 'ortalama', 'm3/sn'
-            ]
+            annual_mean_patterns = self._annual_mean_patterns.get(year)
+            if annual_mean_patterns is None:
+                annual_mean_patterns = self._keyword_patterns([
+                    f'{year} su yılında', 'su yılında', 'yıllık ortalama', 
+                    'annual mean', 'ortalama', 'm3/sn'
+                ])
+                self._annual_mean_patterns[year] = annual_mean_patterns
             
-            total_flow_keywords = [
-                'yıllık toplam', 'total annual', 'toplam',
-                'yıllık toplam akım', 'milyon m3', 'milyon',
-                'yıllık toplam akım', 'toplam akım'
-            ]
-            
-            specific_flow_keywords = [
-                'özgül debi', 'specific flow', 'özgül',
-                'lt/sn/km2', 'lt/sn/km', 'lt/sn',
-                'özgül akım'
-            ]
-            
-            annual_mean = self.extract_numeric_value(full_text, annual_mean_keywords)
-            total_flow = self.extract_numeric_value(full_text, total_flow_keywords)
-            specific_flow = self.extract_numeric_value(full_text, specific_flow_keywords)
+            # Fold case once for all keyword/unit scans; numbers are unaffected by folding
+            folded_text = self.fold_case(full_text)
+            annual_mean = self.extract_numeric_value(folded_text, annual_mean_patterns)
+            total_flow = self.extract_numeric_value(folded_text, self._total_flow_patterns)
+            specific_flow = self.extract_numeric_value(folded_text, self._specific_flow_patterns)
             
             return {
                 'Year': year,
@@ -278,57 +389,56 @@ class DSIExtractor:
             logger.warning(f"Error extracting data for station {station_code}: {e}")
             return None
     
-    def process_pdf(self, pdf_path: Path) -> int:
+    def extract_pdf_rows(self, pdf_path: Path) -> List[List]:
         """
-        Process a single PDF file and extract data for target stations.
+        Extract CSV rows for target stations from a single PDF file.
+        
+        Has no file side effects, so it can run in a worker process.
         
         Args:
             pdf_path: Path to PDF file
             
         Returns:
-            Number of stations found and processed
+            CSV rows in header order (rows found before an error are kept)
         """
         year = self.extract_year_from_filename(pdf_path.name)
         if not year:
             logger.warning(f"Could not extract year from filename: {pdf_path.name}")
-            return 0
+            return []
         
         logger.info(f"Processing {pdf_path.name} (Year: {year})")
         
+        rows = []
         try:
-            doc = fitz.open(pdf_path)
-            stations_found = 0
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Get only the second line for fast station code detection
-                second_line = self.get_second_line_text(page)
-                
-                if not second_line:
-                    continue
-                
-                # Check for station code in second line
-                station_match = self.station_code_pattern.search(second_line)
-                if not station_match:
-                    continue
-                
-                station_code = station_match.group(0)
-                
-                # Check if this is one of our target stations
-                if station_code not in self.target_stations:
-                    continue
-                
-                logger.info(f"Found target station {station_code} on page {page_num + 1}")
-                
-                # Extract full data for this station
-                station_data = self.extract_station_data(page, station_code, year)
-                
-                if station_data:
-                    # Append to CSV
-                    with open(self.output_csv, 'a', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
+            with open_pdf_mapped(pdf_path) as doc:
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+                    
+                    # Cheapest check first: plain station codes in the content stream bytes
+                    if self._skip_by_raw_content(page):
+                        continue
+                    
+                    # Get only the second line (header band) for fast station code detection;
+                    # full_text is kept when the whole page had to be read for it
+                    second_line, full_text = self._read_second_line(page)
+                    
+                    if not second_line:
+                        continue
+                    
+                    # Check for a target station code in second line
+                    station_match = self.target_code_re.search(second_line)
+                    if not station_match:
+                        continue
+                    
+                    station_code = station_match.group(0)
+                    
+                    logger.info(f"Found target station {station_code} on page {page_num + 1}")
+                    
+                    # Extract full data for this station
+                    station_data = self.extract_station_data(page, station_code, year, full_text)
+                    
+                    if station_data:
+                        rows.append([
                             station_data['Year'],
                             station_data['Station_Code'],
                             station_data['Station_Name'],
@@ -338,17 +448,34 @@ class DSIExtractor:
                             station_data['Total_Annual_Flow'],
                             station_data['Specific_Flow']
                         ])
-                    
-                    stations_found += 1
-                    logger.info(f"Extracted data for {station_code}: {station_data['Station_Name']}")
+                        
+                        logger.info(f"Extracted data for {station_code}: {station_data['Station_Name']}")
             
-            doc.close()
-            logger.info(f"Completed {pdf_path.name}: {stations_found} stations found")
-            return stations_found
+            logger.info(f"Completed {pdf_path.name}: {len(rows)} stations found")
             
         except Exception as e:
             logger.error(f"Error processing {pdf_path.name}: {e}")
-            return 0
+        
+        return rows
+    
+    def _extract_pdf_csv(self, pdf_path: Path) -> Tuple[int, str]:
+        """Extract a PDF's rows and serialize them (runs in a worker process)."""
+        rows = self.extract_pdf_rows(pdf_path)
+        return len(rows), self._format_rows(rows)
+    
+    def process_pdf(self, pdf_path: Path) -> int:
+        """
+        Process a single PDF file and append its target station rows to the CSV.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Number of stations found and processed
+        """
+        rows = self.extract_pdf_rows(pdf_path)
+        self._write_rows(rows)
+        return len(rows)
     
     def run(self):
         """Main execution method."""
@@ -369,9 +496,16 @@ class DSIExtractor:
         
         total_stations = 0
         
-        for pdf_file in sorted(pdf_files):
-            stations_found = self.process_pdf(pdf_file)
-            total_stations += stations_found
+        # PDFs are independent: extract and serialize them in parallel, write from
+        # this process only (map keeps the sorted file order)
+        self._open_writer()
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for stations_found, csv_text in executor.map(self._extract_pdf_csv, sorted(pdf_files)):
+                    self._write_csv_text(csv_text)
+                    total_stations += stations_found
+        finally:
+            self._close_writer()
         
         logger.info(f"Processing complete! Total stations extracted: {total_stations}")
         logger.info(f"Results saved to: {self.output_csv}")
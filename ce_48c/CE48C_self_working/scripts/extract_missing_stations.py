@@ -10,8 +10,13 @@ And merges them with the existing dsi_2000_2020_final.csv dataset.
 
 import os
 import re
-import pandas as pd
-import pdfplumber
+import mmap
+import csv
+import itertools
+import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from contextlib import contextmanager
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
@@ -22,16 +27,16 @@ EXISTING_CSV = "dsi_2000_2020_final.csv"
 OUTPUT_CSV = "dsi_2000_2020_final_extended.csv"
 
 # Stations to extract (9 missing stations)
-TARGET_STATIONS = [
+TARGET_STATIONS = frozenset({
     "D14A011", "D14A117", "D14A144", "D14A146", "D14A149", 
     "D14A018", "D22A106", "E22A054", "D22A116"
-]
+})
 
 # Already existing stations (skip these)
-EXISTING_STATIONS = [
+EXISTING_STATIONS = frozenset({
     "D14A162", "D14A172", "D14A192", "D22A093", "D22A095", 
     "D22A105", "D22A158", "E22A065"
-]
+})
 
 # Month order for Turkish months
 MONTH_ORDER = [
@@ -39,6 +44,21 @@ MONTH_ORDER = [
     "Nisan", "Mayıs", "Haziran", "Temmuz", "Ağustos", "Eylül"
 ]
 
+# Regex patterns compiled once at import and reused for every page/line
+_NUM_RE = re.compile(r'[\d.,]+')
+_STATION_RE = re.compile(r"[A-Z]\d{2}[A-Z]\d{3}")
+_COORD_RE = re.compile(r'(\d+°\d+[\'"]?\d*[\'"]?\s*[NSEW])')
+_AREA_RE = re.compile(r'(\d+[.,]\d+)\s*km²')
+
+@contextmanager
+def open_pdf_mapped(pdf_path):
+    """Open a PDF from a read-only memory map of the file (reads served by the OS page cache)."""
+    with open(pdf_path, 'rb') as fh, \
+            mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view, \
+            fitz.open(stream=view, filetype='pdf') as doc:
+        yield doc
+
 def normalize_number(text):
     """Normalize Turkish number format (comma to dot) and convert to float."""
     if not text or text.strip() == '':
@@ -54,26 +74,37 @@ def normalize_number(text):
     except (ValueError, TypeError):
         return None
 
+def year_key(year):
+    """Normalize a year read from CSV text or an extracted record so both compare equal."""
+    try:
+        return int(float(year))
+    except (TypeError, ValueError):
+        return year
+
 def extract_station_codes(text):
     """Extract station codes using regex pattern."""
-    pattern = r"[A-Z]\d{2}[A-Z]\d{3}"
-    return re.findall(pattern, text)
+    return _STATION_RE.findall(text)
+
+def find_first_target_code(text, target_stations):
+    """Return the first station code in text that is a target station, or None."""
+    return next((m.group(0) for m in _STATION_RE.finditer(text) if m.group(0) in target_stations), None)
 
 def find_data_table_lines(text_lines):
-    """Find lines that contain data tables for hydrological measurements."""
+    """Find lines that contain data tables; returns (index, line, numbers) tuples."""
     data_lines = []
     for i, line in enumerate(text_lines):
         line_clean = line.strip()
         # Look for lines that contain multiple numeric values (potential data rows)
-        numbers = re.findall(r'[\d.,]+', line_clean)
+        numbers = _NUM_RE.findall(line_clean)
         if len(numbers) >= 10:  # At least 10 numeric values suggests a data row
-            data_lines.append((i, line_clean))
+            data_lines.append((i, line_clean, numbers))
     return data_lines
 
-def extract_monthly_data(line, month_order):
+def extract_monthly_data(line, month_order, numbers=None):
     """Extract monthly data from a line containing 12 monthly values."""
-    # Find all numeric values in the line
-    numbers = re.findall(r'[\d.,]+', line)
+    # Find all numeric values in the line (unless already scanned by the caller)
+    if numbers is None:
+        numbers = _NUM_RE.findall(line)
     
     if len(numbers) >= 12:
         # Take the first 12 numbers as monthly values
@@ -93,8 +124,18 @@ def extract_monthly_data(line, month_order):
         return monthly_data
     return {}
 
-def extract_station_data_from_page(page_text, station_code, year):
-    """Extract station data from a single page."""
+def find_ortalama_row(page):
+    """Return the 12 monthly cells of the "Ortalama" row from the page's tables, or None."""
+    for table in page.find_tables():
+        for row in table.extract():
+            if row and row[0] and 'ortalama' in row[0].lower():
+                cells = row[1:13]
+                if len(cells) == 12:
+                    return cells
+    return None
+
+def extract_station_data_from_page(page_text, station_code, year, ortalama_cells=None):
+    """Extract station data from a single page (monthly averages from ortalama_cells if given)."""
     lines = page_text.split('\n')
     
     # Find station code in the text
@@ -117,12 +158,12 @@ def extract_station_data_from_page(page_text, station_code, year):
                 nearby_line = lines[j]
                 
                 # Look for coordinates pattern
-                coord_match = re.search(r'(\d+°\d+[\'"]?\d*[\'"]?\s*[NSEW])', nearby_line)
+                coord_match = _COORD_RE.search(nearby_line)
                 if coord_match and not coordinates:
                     coordinates = coord_match.group(1)
                 
                 # Look for catchment area
-                area_match = re.search(r'(\d+[.,]\d+)\s*km²', nearby_line)
+                area_match = _AREA_RE.search(nearby_line)
                 if area_match and catchment_area is None:
                     catchment_area = normalize_number(area_match.group(1))
     
@@ -142,17 +183,23 @@ def extract_station_data_from_page(page_text, station_code, year):
     monthly_mm_akim_data = {}
     monthly_mil_m3_data = {}
     
+    # Monthly averages straight from the table's "Ortalama" row when one was detected
+    if ortalama_cells is not None:
+        monthly_flow_data = extract_monthly_data('', MONTH_ORDER, ortalama_cells)
+        flow_values = [v for v in monthly_flow_data.values() if v is not None]
+        annual_avg_flow = sum(flow_values) / len(flow_values) if flow_values else None
+    
     # Process data lines to find the "Ortalama" (average) row
-    for line_idx, line in data_lines:
+    for line_idx, line, numbers in data_lines:
         line_lower = line.lower()
         
-        # Look for the average row
+        # Look for the average row (regex fallback when no table row was found)
         if 'ortalama' in line_lower or 'average' in line_lower:
-            numbers = re.findall(r'[\d.,]+', line)
-            
+            if ortalama_cells is not None:
+                continue
             if len(numbers) >= 12:
                 # Extract monthly flow data
-                monthly_flow_data = extract_monthly_data(line, MONTH_ORDER)
+                monthly_flow_data = extract_monthly_data(line, MONTH_ORDER, numbers)
                 
                 # Calculate annual average flow
                 flow_values = [v for v in monthly_flow_data.values() if v is not None]
@@ -164,7 +211,6 @@ def extract_station_data_from_page(page_text, station_code, year):
                 annual_avg_flow = None
         else:
             # Look for annual totals in other lines
-            numbers = re.findall(r'[\d.,]+', line)
             if len(numbers) >= 3:
                 # Try to identify annual totals
                 for num_str in numbers:
@@ -213,17 +259,31 @@ def process_pdf_file(pdf_path, target_stations):
     extracted_data = []
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
+        with open_pdf_mapped(pdf_path) as doc:
             year = int(pdf_path.stem.split('_')[1])  # Extract year from filename
             
             print(f"Processing {pdf_path.name} (Year: {year})...")
             
-            for page_num, page in enumerate(pdf.pages):
+            for page_num, page in enumerate(doc):
                 try:
-                    page_text = page.extract_text()
+                    # Skip pages without any target code before materializing their text
+                    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+                    if not any(page.search_for(code, textpage=textpage) for code in target_stations):
+                        continue
+                    
+                    # Reading order, like pdfplumber's line-by-line output
+                    page_text = page.get_text("text", sort=True, textpage=textpage)
+                    
+                    # Search and text extraction are done with this page's layout; free
+                    # MuPDF's copy now instead of holding it through the parsing below
+                    textpage = None
                     if not page_text:
                         continue
                     
+                    # Stop scanning at the first target code; pages without one never build the full list
+                    if find_first_target_code(page_text, target_stations) is None:
+                        continue
+                    
                     # Extract station codes from this page
                     station_codes = extract_station_codes(page_text)
                     
@@ -233,8 +293,11 @@ def process_pdf_file(pdf_path, target_stations):
                     if found_stations:
                         print(f"  Page {page_num + 1}: Found stations {found_stations}")
                         
+                        # Table detection is costly; run it once, and only on target pages
+                        ortalama_cells = find_ortalama_row(page)
+                        
                         for station_code in found_stations:
-                            station_data = extract_station_data_from_page(page_text, station_code, year)
+                            station_data = extract_station_data_from_page(page_text, station_code, year, ortalama_cells)
                             if station_data:
                                 station_data['page'] = page_num + 1
                                 extracted_data.append(station_data)
@@ -267,14 +330,17 @@ def main():
     
     print(f"PDF Folder: {PDF_FOLDER}")
     print(f"Existing CSV: {EXISTING_CSV}")
-    print(f"Target Stations: {', '.join(TARGET_STATIONS)}")
-    print(f"Skipping Existing: {', '.join(EXISTING_STATIONS)}")
+    print(f"Target Stations: {', '.join(sorted(TARGET_STATIONS))}")
+    print(f"Skipping Existing: {', '.join(sorted(EXISTING_STATIONS))}")
     print()
     
     # Load existing data
     print("Loading existing dataset...")
-    existing_df = pd.read_csv(EXISTING_CSV)
-    print(f"SUCCESS: Loaded {len(existing_df)} existing records")
+    with open(EXISTING_CSV, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        fieldnames = list(reader.fieldnames or [])
+        existing_rows = list(reader)
+    print(f"SUCCESS: Loaded {len(existing_rows)} existing records")
     
     # Process all PDF files
     all_extracted_data = []
@@ -282,38 +348,43 @@ def main():
     
     print(f"\nProcessing {len(pdf_files)} PDF files...")
     
-    for pdf_file in pdf_files:
-        extracted_data = process_pdf_file(pdf_file, TARGET_STATIONS)
-        all_extracted_data.extend(extracted_data)
+    # PDFs are independent: process them in parallel (map keeps the sorted file order)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for extracted_data in executor.map(partial(process_pdf_file, target_stations=TARGET_STATIONS), pdf_files):
+            all_extracted_data.extend(extracted_data)
     
     print(f"\nExtraction Summary:")
     print(f"   Total records extracted: {len(all_extracted_data)}")
     
     if all_extracted_data:
-        # Convert to DataFrame
-        new_df = pd.DataFrame(all_extracted_data)
-        
-        # Count unique stations found
-        unique_stations = new_df['station_code'].unique()
+        # Count unique stations found (in order of first appearance)
+        unique_stations = list(dict.fromkeys(record['station_code'] for record in all_extracted_data))
         print(f"   Unique stations found: {len(unique_stations)}")
         print(f"   Stations: {', '.join(unique_stations)}")
         
         # Merge with existing data
         print(f"\nMerging with existing data...")
-        merged_df = pd.concat([existing_df, new_df], ignore_index=True)
+        # Extracted columns not in the existing file go after the existing ones
+        for record in all_extracted_data:
+            fieldnames.extend(key for key in record if key not in fieldnames)
         
-        # Remove duplicates based on station_code and year
+        # Remove duplicates based on station_code and year (first record per key wins)
         print("Removing duplicates...")
-        initial_count = len(merged_df)
-        merged_df = merged_df.drop_duplicates(subset=['station_code', 'year'], keep='first')
-        final_count = len(merged_df)
+        initial_count = len(existing_rows) + len(all_extracted_data)
+        merged = {}
+        for record in itertools.chain(existing_rows, all_extracted_data):
+            merged.setdefault((record['station_code'], year_key(record['year'])), record)
+        final_count = len(merged)
         duplicates_removed = initial_count - final_count
         
         print(f"   Removed {duplicates_removed} duplicate records")
         
         # Save the extended dataset
         print(f"\nSaving extended dataset to {OUTPUT_CSV}...")
-        merged_df.to_csv(OUTPUT_CSV, index=False, encoding='utf-8')
+        with open(OUTPUT_CSV, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+            writer.writeheader()
+            writer.writerows(merged.values())
         
         # Print final summary
         print(f"\nSUCCESS!")
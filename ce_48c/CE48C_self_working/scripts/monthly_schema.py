@@ -0,0 +1,95 @@
+"""
+Shared month/metric column metadata for the monthly chart scripts
+"""
+
+# Month names for display (water year, starting from October)
+MONTH_NAMES = ['Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar', 
+               'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep']
+
+# Same months in Turkish
+MONTH_NAMES_TR = ['Ekim', 'Kasım', 'Aralık', 'Ocak', 'Şubat', 'Mart', 
+                  'Nisan', 'Mayıs', 'Haziran', 'Temmuz', 'Ağustos', 'Eylül']
+
+# Positions of each season's months within MONTH_NAMES / a metric's columns
+SEASON_IDX = {
+    'Autumn': [0, 1, 2],
+    'Winter': [3, 4, 5],
+    'Spring': [6, 7, 8],
+    'Summer': [9, 10, 11]
+}
+
+# The 6 metrics and their monthly columns (water year, starting from October)
+METRICS = {
+    'Flow Max (m³/s)': {
+        'columns': ['oct_flow_max_m3', 'nov_flow_max_m3', 'dec_flow_max_m3', 
+                   'jan_flow_max_m3', 'feb_flow_max_m3', 'mar_flow_max_m3',
+                   'apr_flow_max_m3', 'may_flow_max_m3', 'jun_flow_max_m3',
+                   'jul_flow_max_m3', 'aug_flow_max_m3', 'sep_flow_max_m3'],
+        'color': '#FF6B6B',
+        'unit': 'm³/s'
+    },
+    'Flow Min (m³/s)': {
+        'columns': ['oct_flow_min_m3', 'nov_flow_min_m3', 'dec_flow_min_m3',
+                   'jan_flow_min_m3', 'feb_flow_min_m3', 'mar_flow_min_m3',
+                   'apr_flow_min_m3', 'may_flow_min_m3', 'jun_flow_min_m3',
+                   'jul_flow_min_m3', 'aug_flow_min_m3', 'sep_flow_min_m3'],
+        'color': '#4ECDC4',
+        'unit': 'm³/s'
+    },
+    'Flow Average (m³/s)': {
+        'columns': ['oct_flow_avg_m3', 'nov_flow_avg_m3', 'dec_flow_avg_m3',
+                   'jan_flow_avg_m3', 'feb_flow_avg_m3', 'mar_flow_avg_m3',
+                   'apr_flow_avg_m3', 'may_flow_avg_m3', 'jun_flow_avg_m3',
+                   'jul_flow_avg_m3', 'aug_flow_avg_m3', 'sep_flow_avg_m3'],
+        'color': '#45B7D1',
+        'unit': 'm³/s'
+    },
+    'Flow per km² (l/s/km²)': {
+        'columns': ['oct_ltsnkm2_m3', 'nov_ltsnkm2_m3', 'dec_ltsnkm2_m3',
+                   'jan_ltsnkm2_m3', 'feb_ltsnkm2_m3', 'mar_ltsnkm2_m3',
+                   'apr_ltsnkm2_m3', 'may_ltsnkm2_m3', 'jun_ltsnkm2_m3',
+                   'jul_ltsnkm2_m3', 'aug_ltsnkm2_m3', 'sep_ltsnkm2_m3'],
+        'color': '#96CEB4',
+        'unit': 'l/s/km²'
+    },
+    'Flow in mm': {
+        'columns': ['oct_akim_mm_m3', 'nov_akim_mm_m3', 'dec_akim_mm_m3',
+                   'jan_akim_mm_m3', 'feb_akim_mm_m3', 'mar_akim_mm_m3',
+                   'apr_akim_mm_m3', 'may_akim_mm_m3', 'jun_akim_mm_m3',
+                   'jul_akim_mm_m3', 'aug_akim_mm_m3', 'sep_akim_mm_m3'],
+        'color': '#FFEAA7',
+        'unit': 'mm'
+    },
+    'Flow in million m³': {
+        'columns': ['oct_milm3_m3', 'nov_milm3_m3', 'dec_milm3_m3',
+                   'jan_milm3_m3', 'feb_milm3_m3', 'mar_milm3_m3',
+                   'apr_milm3_m3', 'may_milm3_m3', 'jun_milm3_m3',
+                   'jul_milm3_m3', 'aug_milm3_m3', 'sep_milm3_m3'],
+        'color': '#DDA0DD',
+        'unit': 'million m³'
+    }
+}
+
+# Monthly columns of the cleaned (Turkish-named) CSV
+SIMPLE_MONTHLY_COLUMNS = {
+    'flow': ['flow_october_m3s', 'flow_november_m3s', 'flow_december_m3s', 
+             'flow_january_m3s', 'flow_february_m3s', 'flow_march_m3s',
+             'flow_april_m3s', 'flow_may_m3s', 'flow_june_m3s', 
+             'flow_july_m3s', 'flow_august_m3s', 'flow_september_m3s'],
+    'ltsnkm2': ['ltsnkm2_Ekim', 'ltsnkm2_Kasım', 'ltsnkm2_Aralık', 
+                'ltsnkm2_Ocak', 'ltsnkm2_Şubat', 'ltsnkm2_Mart',
+                'ltsnkm2_Nisan', 'ltsnkm2_Mayıs', 'ltsnkm2_Haziran', 
+                'ltsnkm2_Temmuz', 'ltsnkm2_Ağustos', 'ltsnkm2_Eylül'],
+    'mm_akim': ['mm_akim_Ekim', 'mm_akim_Kasım', 'mm_akim_Aralık', 
+                'mm_akim_Ocak', 'mm_akim_Şubat', 'mm_akim_Mart',
+                'mm_akim_Nisan', 'mm_akim_Mayıs', 'mm_akim_Haziran', 
+                'mm_akim_Temmuz', 'mm_akim_Ağustos', 'mm_akim_Eylül'],
+    'mil_m3': ['mil_m3_Ekim', 'mil_m3_Kasım', 'mil_m3_Aralık', 
+               'mil_m3_Ocak', 'mil_m3_Şubat', 'mil_m3_Mart',
+               'mil_m3_Nisan', 'mil_m3_Mayıs', 'mil_m3_Haziran', 
+               'mil_m3_Temmuz', 'mil_m3_Ağustos', 'mil_m3_Eylül']
+}
+
+# Annual average columns of the cleaned CSV
+SIMPLE_ANNUAL_COLUMNS = ['flow_avg_annual_m3s', 'ltsnkm2_average',
+                         'mm_akim_annual_average', 'mil_m3_annual_average']